@@ -6,16 +6,9 @@ import asyncio
 import json
 import logging
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-try:
-    from openai import AsyncOpenAI
-
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    AsyncOpenAI = None  # type: ignore
-
 from tsxbot.ai.models import MarketContext, TradeAnalysis, TradeResult, TradeValidation
 from tsxbot.ai.prompts import (
     POST_TRADE_SYSTEM_PROMPT,
@@ -25,6 +18,8 @@ from tsxbot.ai.prompts import (
 )
 
 if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
     from tsxbot.config_loader import OpenAIConfig
     from tsxbot.strategies.base import TradeSignal
 
@@ -37,6 +32,35 @@ RESET = "\033[0m"
 BRAIN_EMOJI = ""
 
 
+@lru_cache(maxsize=256)
+def _parse_validation_payload(
+    raw_response: str,
+) -> tuple[int, tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """
+    Parse a raw pre-trade response into (confidence, observations, risks, suggestions).
+
+    Cached by raw text so replayed responses (retries, dry-run replays) skip the
+    JSON decode. Parse failures raise and are therefore never cached. Missing or
+    null lists come back empty.
+    """
+    # Clean up response (remove any markdown code blocks if present)
+    clean = raw_response.strip()
+    if clean.startswith("```"):
+        clean = clean.split("```")[1]
+        if clean.startswith("json"):
+            clean = clean[4:]
+    clean = clean.strip()
+
+    data = json.loads(clean)
+
+    return (
+        int(data.get("confidence", 5)),
+        tuple(data.get("observations") or ()),
+        tuple(data.get("risks") or ()),
+        tuple(data.get("suggestions") or ()),
+    )
+
+
 class AIAdvisor:
     """
     OpenAI-powered trade intelligence advisor.
@@ -70,14 +94,17 @@ class AIAdvisor:
             logger.info("AI Advisor disabled in config")
             return
 
-        if not OPENAI_AVAILABLE:
-            logger.warning("OpenAI package not installed. Run: pip install openai")
-            return
-
         if not config.api_key or config.api_key.startswith("${"):
             logger.warning("OpenAI API key not configured. Set OPENAI_API_KEY in .env")
             return
 
+        # Import lazily: the SDK is only needed once a client will actually be built
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            logger.warning("OpenAI package not installed. Run: pip install openai")
+            return
+
         self._client = AsyncOpenAI(api_key=config.api_key)
         logger.info(f"AI Advisor initialized with model: {config.model}")
 
@@ -194,24 +221,7 @@ class AIAdvisor:
     def _parse_validation_response(self, raw_response: str, latency_ms: int) -> TradeValidation:
         """Parse JSON response from OpenAI into TradeValidation."""
         try:
-            # Clean up response (remove any markdown code blocks if present)
-            clean = raw_response.strip()
-            if clean.startswith("```"):
-                clean = clean.split("```")[1]
-                if clean.startswith("json"):
-                    clean = clean[4:]
-            clean = clean.strip()
-
-            data = json.loads(clean)
-
-            return TradeValidation(
-                confidence=int(data.get("confidence", 5)),
-                observations=data.get("observations", []),
-                risks=data.get("risks", []),
-                suggestions=data.get("suggestions", []),
-                raw_response=raw_response,
-                latency_ms=latency_ms,
-            )
+            confidence, observations, risks, suggestions = _parse_validation_payload(raw_response)
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning(f"Failed to parse AI response: {e}")
             return TradeValidation(
@@ -221,6 +231,15 @@ class AIAdvisor:
                 latency_ms=latency_ms,
             )
 
+        return TradeValidation(
+            confidence=confidence,
+            observations=list(observations),
+            risks=list(risks),
+            suggestions=list(suggestions),
+            raw_response=raw_response,
+            latency_ms=latency_ms,
+        )
+
     async def analyze_completed_trade(self, trade_result: TradeResult) -> TradeAnalysis | None:
         """
         Post-trade analysis: What worked, what didn't, lessons learned.
@@ -240,25 +259,27 @@ class AIAdvisor:
             await self._rate_limit_wait()
 
             # Build trade result string
-            result_str = (
-                f"Symbol: {trade_result.symbol}\n"
-                f"Direction: {trade_result.direction}\n"
-                f"Entry: {trade_result.entry_price}\n"
-                f"Exit: {trade_result.exit_price}\n"
-                f"Quantity: {trade_result.quantity}\n"
-                f"P&L: {trade_result.pnl_ticks} ticks (${trade_result.pnl_usd})\n"
-                f"Duration: {trade_result.duration_seconds}s\n"
-                f"Exit Reason: {trade_result.exit_reason}\n"
-                f"Signal Reason: {trade_result.signal_reason}"
-            )
+            lines = [
+                f"Symbol: {trade_result.symbol}",
+                f"Direction: {trade_result.direction}",
+                f"Entry: {trade_result.entry_price}",
+                f"Exit: {trade_result.exit_price}",
+                f"Quantity: {trade_result.quantity}",
+                f"P&L: {trade_result.pnl_ticks} ticks (${trade_result.pnl_usd})",
+                f"Duration: {trade_result.duration_seconds}s",
+                f"Exit Reason: {trade_result.exit_reason}",
+                f"Signal Reason: {trade_result.signal_reason}",
+            ]
 
             if trade_result.ai_confidence_at_entry:
-                result_str += f"\nAI Confidence at Entry: {trade_result.ai_confidence_at_entry}/10"
+                lines.append(f"AI Confidence at Entry: {trade_result.ai_confidence_at_entry}/10")
 
             if trade_result.entry_context:
-                result_str += f"\n\nMarket Context at Entry:\n{trade_result.entry_context.to_prompt_context()}"
+                lines.append("")
+                lines.append("Market Context at Entry:")
+                lines.append(trade_result.entry_context.to_prompt_context())
 
-            user_prompt = build_post_trade_prompt(result_str)
+            user_prompt = build_post_trade_prompt("\n".join(lines))
 
             # Call OpenAI
             response = await asyncio.wait_for(
@@ -6,6 +6,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+# Fixed leading block of MarketContext.to_prompt_context; filled from the
+# instance fields so the header layout lives in one place.
+_PROMPT_HEADER_TEMPLATE = (
+    "Symbol: {symbol}\n"
+    "Time: {minutes_since_open} mins since RTH open ({session_phase})\n"
+    "Price: {current_price}\n"
+    "Session Range: {session_low} - {session_high}"
+)
+
 
 @dataclass
 class MarketContext:
@@ -54,12 +63,7 @@ class MarketContext:
 
     def to_prompt_context(self) -> str:
         """Format context for LLM prompt."""
-        lines = [
-            f"Symbol: {self.symbol}",
-            f"Time: {self.minutes_since_open} mins since RTH open ({self.session_phase})",
-            f"Price: {self.current_price}",
-            f"Session Range: {self.session_low} - {self.session_high}",
-        ]
+        lines = [_PROMPT_HEADER_TEMPLATE.format_map(vars(self))]
 
         if self.opening_range_high and self.opening_range_low:
             lines.append(f"Opening Range: {self.opening_range_low} - {self.opening_range_high}")
@@ -18,7 +18,7 @@ from tsxbot.broker.models import (
     Position,
 )
 from tsxbot.config_loader import AppConfig
-from tsxbot.data.market_data import Tick
+from tsxbot.data.market_data import Tick, price_to_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -336,7 +336,7 @@ class ProjectXBroker(Broker):
             # Convert to internal Tick format
             tick = Tick(
                 symbol=str(symbol),
-                price=Decimal(str(price)),
+                price=price_to_decimal(price),
                 volume=int(volume) if volume else 0,
                 timestamp=datetime.now(),
             )
@@ -31,11 +31,25 @@ class SimBroker(Broker):
         super().__init__()
         self.symbols_config = symbols_config
         self.execution_config = execution_config or ExecutionConfig()
+        # Point multipliers are fixed for the broker's lifetime; resolve them once
+        self._multipliers = symbols_config.multipliers
+        self._initial_balance = initial_balance
         self._balance = initial_balance
         self._orders: dict[str, Order] = {}
         self._positions: dict[str, Position] = defaultdict(lambda: Position(symbol=""))
         self._last_ticks: dict[str, Tick] = {}
 
+    def reset(self) -> None:
+        """
+        Clear orders, positions and market data, and restore the initial balance.
+
+        Registered fill and tick callbacks are kept.
+        """
+        self._balance = self._initial_balance
+        self._orders.clear()
+        self._positions.clear()
+        self._last_ticks.clear()
+
     async def connect(self) -> None:
         logger.info(f"SimBroker connected. Balance: {self._balance}")
 
@@ -181,13 +195,8 @@ class SimBroker(Broker):
         pos = self._positions[symbol]
         pos.symbol = symbol  # Ensure set
 
-        # Calculate Multiplier
-        # Resolve config
-        mult = Decimal("50.0")  # Default ES
-        if "MES" in symbol:
-            mult = Decimal("5.0")
-        # Better: lookup strictly if possible
-        # (Assuming standard logic for MVP)
+        # Point multiplier from the symbol spec (ES unless the symbol is a micro)
+        mult = self._multipliers["MES" if "MES" in symbol else "ES"]
 
         qty_signed = fill.qty if fill.side == OrderSide.BUY else -fill.qty
 
@@ -23,6 +23,25 @@ from tsxbot.constants import (
     TradingEnvironment,
 )
 
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+_HHMM_PATTERN = re.compile(r"^(\d{2}):(\d{2})$")
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Resolve a single ${VAR} / ${VAR:default} match."""
+    var_name = match.group(1)
+    default = match.group(2)
+
+    env_value = os.environ.get(var_name)
+
+    if env_value is not None:
+        return env_value
+    elif default is not None:
+        return default
+    else:
+        # Return empty string for optional unset vars without default
+        return ""
+
 
 def interpolate_env_vars(value: Any) -> Any:
     """
@@ -32,42 +51,60 @@ def interpolate_env_vars(value: Any) -> Any:
     - ${VAR_NAME} - required, raises if not set
     - ${VAR_NAME:default} - optional with default value
     """
-    if not isinstance(value, str):
+    # Plain strings without a "$" cannot contain a reference; skip the regex
+    if not isinstance(value, str) or "$" not in value:
         return value
 
-    pattern = r"\$\{([^}:]+)(?::([^}]*))?\}"
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
-    def replacer(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        default = match.group(2)
 
-        env_value = os.environ.get(var_name)
-
-        if env_value is not None:
-            return env_value
-        elif default is not None:
-            return default
-        else:
-            # Return empty string for optional unset vars without default
-            return ""
+def _process_config_value(value: Any) -> tuple[Any, bool]:
+    """
+    Interpolate env vars in a single config value, recursing into containers.
 
-    return re.sub(pattern, replacer, value)
+    Returns (value, changed). Containers whose children are all unchanged are
+    returned as the original object rather than a copy.
+    """
+    # Exact type checks: YAML only produces plain dicts/lists/strs, and most
+    # leaves are numbers or bools that need no work at all.
+    value_type = type(value)
+    if value_type is dict:
+        return _process_config_mapping(value)
+    if value_type is list:
+        new_list: list[Any] | None = None
+        for index, item in enumerate(value):
+            new_item, changed = _process_config_value(item)
+            if changed:
+                if new_list is None:
+                    new_list = list(value)
+                new_list[index] = new_item
+        return (value, False) if new_list is None else (new_list, True)
+    if value_type is str and "$" in value:
+        interpolated = interpolate_env_vars(value)
+        return interpolated, interpolated != value
+    return value, False
+
+
+def _process_config_mapping(data: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    """Dict branch of _process_config_value; copies only when a child changed."""
+    new_dict: dict[str, Any] | None = None
+    for key, value in data.items():
+        new_value, changed = _process_config_value(value)
+        if changed:
+            if new_dict is None:
+                new_dict = dict(data)
+            new_dict[key] = new_value
+    return (data, False) if new_dict is None else (new_dict, True)
 
 
 def process_config_dict(data: dict[str, Any]) -> dict[str, Any]:
-    """Recursively process config dict to interpolate env vars."""
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            result[key] = process_config_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                process_config_dict(item) if isinstance(item, dict) else interpolate_env_vars(item)
-                for item in value
-            ]
-        else:
-            result[key] = interpolate_env_vars(value)
-    return result
+    """
+    Recursively process config dict to interpolate env vars.
+
+    The input is never mutated. Subtrees without any interpolation are shared
+    with the input, so a config with no ${...} references is returned as-is.
+    """
+    return _process_config_mapping(data)[0]
 
 
 # ============================================
@@ -125,6 +162,14 @@ class SymbolsConfig(BaseModel):
         )
     )
 
+    @property
+    def multipliers(self) -> dict[str, Decimal]:
+        """Dollar value of a one-point move per contract, keyed by ES/MES."""
+        return {
+            "ES": self.es.tick_value / self.es.tick_size,
+            "MES": self.mes.tick_value / self.mes.tick_size,
+        }
+
     def get_contract_id(self, symbol: str) -> str:
         """Build full contract ID from symbol name (ES or MES)."""
         if symbol.upper() == "ES" or symbol == self.primary:
@@ -149,9 +194,10 @@ class SessionConfig(BaseModel):
     @classmethod
     def validate_time_format(cls, v: str) -> str:
         """Validate time is in HH:MM format."""
-        if not re.match(r"^\d{2}:\d{2}$", v):
+        match = _HHMM_PATTERN.match(v)
+        if match is None:
             raise ValueError(f"Time must be in HH:MM format, got: {v}")
-        hours, minutes = map(int, v.split(":"))
+        hours, minutes = int(match.group(1)), int(match.group(2))
         if not (0 <= hours <= 23 and 0 <= minutes <= 59):
             raise ValueError(f"Invalid time value: {v}")
         return v
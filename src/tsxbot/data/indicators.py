@@ -7,8 +7,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_TWO = Decimal("2")
 
-@dataclass
+
+@dataclass(slots=True)
 class Bar:
     """OHLCV bar data."""
 
@@ -186,18 +190,18 @@ def calculate_ema(prices: Sequence[Decimal], period: int) -> Decimal:
         Current EMA value, or Decimal("0") if insufficient data
     """
     if len(prices) < period:
-        return Decimal("0")
+        return _ZERO
 
     # Multiplier
-    k = Decimal("2") / (Decimal(str(period)) + Decimal("1"))
+    k = _TWO / (Decimal(period) + _ONE)
+    one_minus_k = _ONE - k
 
     # Start with SMA for first EMA value
-    sma = sum(prices[:period]) / Decimal(str(period))
-    ema = sma
+    ema = sum(prices[:period]) / Decimal(period)
 
     # Calculate EMA for remaining prices
     for price in prices[period:]:
-        ema = price * k + ema * (Decimal("1") - k)
+        ema = price * k + ema * one_minus_k
 
     return ema
 
@@ -206,6 +210,9 @@ def calculate_ema_series(bars: Sequence[Bar], period: int) -> list[Decimal]:
     """
     Calculate EMA series for all bars.
 
+    Callers that only need the latest value should use ``calculate_ema`` on the
+    closes instead, which skips building the series.
+
     Args:
         bars: Sequence of OHLCV bars (oldest first)
         period: EMA period
@@ -214,25 +221,23 @@ def calculate_ema_series(bars: Sequence[Bar], period: int) -> list[Decimal]:
         List of EMA values aligned with bars (zeros for insufficient data)
     """
     if len(bars) < period:
-        return [Decimal("0")] * len(bars)
+        return [_ZERO] * len(bars)
 
     closes = [bar.close for bar in bars]
-    result: list[Decimal] = []
 
-    k = Decimal("2") / (Decimal(str(period)) + Decimal("1"))
+    k = _TWO / (Decimal(period) + _ONE)
+    one_minus_k = _ONE - k
 
     # First period-1 values are zero (insufficient data)
-    for _ in range(period - 1):
-        result.append(Decimal("0"))
+    result: list[Decimal] = [_ZERO] * (period - 1)
 
     # First EMA is SMA
-    sma = sum(closes[:period]) / Decimal(str(period))
-    result.append(sma)
-    ema = sma
+    ema = sum(closes[:period]) / Decimal(period)
+    result.append(ema)
 
     # Calculate EMA for remaining bars
-    for i in range(period, len(bars)):
-        ema = closes[i] * k + ema * (Decimal("1") - k)
+    for close in closes[period:]:
+        ema = close * k + ema * one_minus_k
         result.append(ema)
 
     return result
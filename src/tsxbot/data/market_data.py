@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tick:
     """Individual trade tick."""
 
@@ -27,3 +28,15 @@ class DOMUpdate:
     ask_price: Decimal
     bid_size: int
     ask_size: int
+
+
+@lru_cache(maxsize=4096, typed=True)
+def price_to_decimal(value: str | int | float) -> Decimal:
+    """
+    Convert a raw feed price to Decimal.
+
+    Futures prices move in fixed ticks inside a narrow intraday range, so the
+    same handful of values repeat constantly; caching skips the str/Decimal
+    parse for them.
+    """
+    return Decimal(str(value))
@@ -83,6 +83,14 @@ class ExecutionEngine:
 
         self.broker.add_fill_callback(self.on_fill)
 
+    def reset(self) -> None:
+        """Forget all tracked trades and accumulated AI feedback."""
+        self.active_trades.clear()
+        self.order_map.clear()
+        self.accumulated_lessons.clear()
+        self._last_ai_confidence = None
+        self._last_market_context = None
+
     def _get_tick_size(self, symbol: str) -> Decimal:
         if symbol == self.symbols_config.mes.contract_id_prefix or "MES" in symbol:
             return self.symbols_config.mes.tick_size
@@ -8,6 +8,7 @@ Features captured:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from decimal import Decimal
@@ -122,6 +123,12 @@ class FeatureEngine:
         self.ema_fast_period = ema_fast_period
         self.ema_slow_period = ema_slow_period
 
+        # EMA multipliers and their complements
+        self._mult_fast = Decimal(2) / (ema_fast_period + 1)
+        self._mult_slow = Decimal(2) / (ema_slow_period + 1)
+        self._keep_fast = 1 - self._mult_fast
+        self._keep_slow = 1 - self._mult_slow
+
         # EMA state
         self._ema_fast: Decimal | None = None
         self._ema_slow: Decimal | None = None
@@ -228,6 +235,36 @@ class FeatureEngine:
 
         return snapshot
 
+    def warmup(self, prices: Iterable[Decimal]) -> None:
+        """
+        Seed rolling trend state from historical prices.
+
+        Equivalent to calling compute_snapshot once per price with no levels,
+        volume or bar range, but skips building and classifying a snapshot
+        for each one.
+        """
+        mult_fast = self._mult_fast
+        mult_slow = self._mult_slow
+        keep_fast = self._keep_fast
+        keep_slow = self._keep_slow
+
+        ema_fast = self._ema_fast
+        ema_slow = self._ema_slow
+        count = 0
+
+        for price in prices:
+            count += 1
+            if ema_fast is None or ema_slow is None:
+                ema_fast = price
+                ema_slow = price
+            else:
+                ema_fast = price * mult_fast + ema_fast * keep_fast
+                ema_slow = price * mult_slow + ema_slow * keep_slow
+
+        self._ema_fast = ema_fast
+        self._ema_slow = ema_slow
+        self._price_count += count
+
     def _update_ema(self, price: Decimal) -> None:
         """Update EMA values."""
         self._price_count += 1
@@ -236,12 +273,8 @@ class FeatureEngine:
             self._ema_fast = price
             self._ema_slow = price
         else:
-            # EMA multiplier
-            mult_fast = Decimal(2) / (self.ema_fast_period + 1)
-            mult_slow = Decimal(2) / (self.ema_slow_period + 1)
-
-            self._ema_fast = price * mult_fast + self._ema_fast * (1 - mult_fast)
-            self._ema_slow = price * mult_slow + self._ema_slow * (1 - mult_slow)
+            self._ema_fast = price * self._mult_fast + self._ema_fast * self._keep_fast
+            self._ema_slow = price * self._mult_slow + self._ema_slow * self._keep_slow
 
     def _update_volume(self, volume: int) -> None:
         """Update volume moving average."""
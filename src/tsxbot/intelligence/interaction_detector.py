@@ -88,6 +88,7 @@ class InteractionDetector:
     ):
         self.tick_size = tick_size
         self.touch_threshold = tick_size * touch_threshold_ticks
+        self._reject_distance = self.touch_threshold * 2
         self.reject_bars = reject_bars
         self.hold_bars = hold_bars
         self.fakeout_bars = fakeout_bars
@@ -222,35 +223,40 @@ class InteractionDetector:
         timestamp: datetime,
     ) -> list[LevelInteraction]:
         """Process pending touches for potential upgrade to REJECT."""
-        confirmed: list[LevelInteraction] = []
-        still_pending: list[tuple[LevelInteraction, int]] = []
+        # Touches are appended in bar order, so the ones due for confirmation
+        # are always a prefix of the pending list.
+        due = 0
+        for _, touch_bar in self._pending:
+            if self._bar_count - touch_bar < self.reject_bars:
+                break
+            due += 1
 
-        for interaction, touch_bar in self._pending:
-            bars_since_touch = self._bar_count - touch_bar
+        if not due:
+            return []
 
-            if bars_since_touch >= self.reject_bars:
-                # Check if price has moved away (rejection)
-                level_price = interaction.level_price
-                distance = abs(current_price - level_price)
+        confirmed: list[LevelInteraction] = []
 
-                # If price moved significantly away, upgrade to REJECT
-                if distance > self.touch_threshold * 2:
-                    reject_interaction = LevelInteraction(
-                        timestamp=timestamp,
-                        level_name=interaction.level_name,
-                        level_price=level_price,
-                        interaction_type=InteractionType.REJECT,
-                        price_at_interaction=current_price,
-                        direction=interaction.direction,
-                    )
-                    confirmed.append(reject_interaction)
-                else:
-                    # Just a touch, confirm as-is
-                    confirmed.append(interaction)
+        for interaction, _ in self._pending[:due]:
+            # Check if price has moved away (rejection)
+            level_price = interaction.level_price
+            distance = abs(current_price - level_price)
+
+            # If price moved significantly away, upgrade to REJECT
+            if distance > self._reject_distance:
+                reject_interaction = LevelInteraction(
+                    timestamp=timestamp,
+                    level_name=interaction.level_name,
+                    level_price=level_price,
+                    interaction_type=InteractionType.REJECT,
+                    price_at_interaction=current_price,
+                    direction=interaction.direction,
+                )
+                confirmed.append(reject_interaction)
             else:
-                still_pending.append((interaction, touch_bar))
+                # Just a touch, confirm as-is
+                confirmed.append(interaction)
 
-        self._pending = still_pending
+        del self._pending[:due]
         return confirmed
 
     def reset(self) -> None:
@@ -12,6 +12,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,6 +21,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _price_to_ticks(price: Decimal, tick_size: Decimal) -> int | None:
+    """Convert a price to a whole number of ticks, or None if it is off the tick grid."""
+    ticks = price / tick_size
+    if ticks != ticks.to_integral_value():
+        return None
+    return int(ticks)
+
+
+@lru_cache(maxsize=4096)
+def _warn_off_grid(price: Decimal, tick_size: Decimal) -> None:
+    """Warn about an off-grid price; the cache keeps repeats of it out of the log."""
+    logger.warning(f"Price {price} is not on the {tick_size} tick grid")
+
+
 @dataclass
 class SessionLevels:
     """Computed levels for a trading session."""
@@ -40,7 +56,9 @@ class SessionLevels:
     # VWAP
     vwap: Decimal | None = None
 
-    # Internal VWAP calculation state
+    # Internal VWAP calculation state: on-grid prices accumulate as ticks x volume,
+    # anything off the tick grid as an exact Decimal price x volume
+    _cumulative_pv_ticks: int = field(default=0, repr=False)
     _cumulative_pv: Decimal = field(default=Decimal("0"), repr=False)
     _cumulative_volume: int = field(default=0, repr=False)
 
@@ -77,10 +95,12 @@ class LevelStore:
         rth_start: time = time(9, 30),
         rth_end: time = time(16, 0),
         opening_range_minutes: int = 30,
+        tick_size: Decimal = Decimal("0.25"),
     ):
         self.rth_start = rth_start
         self.rth_end = rth_end
         self.opening_range_minutes = opening_range_minutes
+        self.tick_size = tick_size
         self._or_end_time = self._add_minutes(rth_start, opening_range_minutes)
 
         # Current session state
@@ -155,11 +175,17 @@ class LevelStore:
             self._levels.or_formed = True
             logger.info(f"Opening Range formed: ORH={self._levels.orh}, ORL={self._levels.orl}")
 
-        # VWAP calculation
-        self._levels._cumulative_pv += price * volume
+        # VWAP calculation, accumulated in integer ticks where possible
+        ticks = _price_to_ticks(price, self.tick_size)
+        if ticks is None:
+            _warn_off_grid(price, self.tick_size)
+            self._levels._cumulative_pv += price * volume
+        else:
+            self._levels._cumulative_pv_ticks += ticks * volume
         self._levels._cumulative_volume += volume
         if self._levels._cumulative_volume > 0:
-            self._levels.vwap = self._levels._cumulative_pv / self._levels._cumulative_volume
+            pv = self.tick_size * self._levels._cumulative_pv_ticks + self._levels._cumulative_pv
+            self._levels.vwap = pv / self._levels._cumulative_volume
 
         self._last_price = price
 
@@ -35,11 +35,22 @@ class Journaler:
     """
 
     def __init__(self, db_path: str | Path):
+        """
+        Args:
+            db_path: Database file path, or an SQLite URI such as
+                "file:journal?mode=memory&cache=shared". With a shared in-memory
+                URI the caller must hold a connection open for the data to persist.
+        """
         self.db_path = str(db_path)
+        self._is_uri = self.db_path.startswith("file:")
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journaler")
         self.run_id: int | None = None
         self._conn: sqlite3.Connection | None = None  # Only used in the worker thread
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the journal database."""
+        return sqlite3.connect(self.db_path, uri=self._is_uri)
+
     async def initialize(self) -> None:
         """Initialize database schema."""
         loop = asyncio.get_running_loop()
@@ -49,9 +60,10 @@ class Journaler:
         """Synchronous DB initialization."""
         try:
             # Ensure directory exists
-            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            if not self._is_uri:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("PRAGMA foreign_keys = ON;")
                 for stmt in SCHEMA_STATEMENTS:
                     conn.execute(stmt)
@@ -67,7 +79,7 @@ class Journaler:
         logger.info(f"Journal run started: ID {self.run_id}")
 
     def _insert_run_sync(self, config: AppConfig) -> int:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -99,7 +111,7 @@ class Journaler:
         sig_dir = d.signal.direction.value if d.signal else None
         sig_qty = d.signal.quantity if d.signal else None
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO decisions (run_id, timestamp, symbol, strategy, signal_direction, signal_qty, features_json, reason)
@@ -127,7 +139,7 @@ class Journaler:
         await loop.run_in_executor(self._executor, self._log_order_sync, order, self.run_id)
 
     def _log_order_sync(self, order: Order, run_id: int) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Upsert logic (REPLACE INTO or INSERT OR REPLACE)
             conn.execute(
                 """
@@ -168,7 +180,7 @@ class Journaler:
         await loop.run_in_executor(self._executor, self._log_fill_sync, fill, self.run_id)
 
     def _log_fill_sync(self, fill: Fill, run_id: int) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO fills (
@@ -253,7 +265,7 @@ class Journaler:
             if direction
             else None
         )
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT INTO ai_insights (
@@ -288,7 +300,7 @@ class Journaler:
         self._executor.shutdown(wait=True)
 
     def _close_run_sync(self, run_id: int) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "UPDATE runs SET end_time = ? WHERE id = ?", (datetime.now().isoformat(), run_id)
             )
@@ -9,15 +9,9 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from openai import AsyncOpenAI
 
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    AsyncOpenAI = None  # type: ignore
-
-if TYPE_CHECKING:
     from tsxbot.config_loader import OpenAIConfig
     from tsxbot.learning.param_store import StrategyParams
 
@@ -60,8 +54,16 @@ class AIRecommender:
         self.config = config
         self._client: AsyncOpenAI | None = None
 
-        if self.config.enabled and OPENAI_AVAILABLE and self.config.api_key:
-            self._client = AsyncOpenAI(api_key=self.config.api_key)
+        if not (self.config.enabled and self.config.api_key):
+            return
+
+        # Import lazily: the SDK is only needed once a client will actually be built
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            return
+
+        self._client = AsyncOpenAI(api_key=self.config.api_key)
 
     @property
     def is_available(self) -> bool:
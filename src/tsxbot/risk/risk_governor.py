@@ -93,6 +93,17 @@ class RiskGovernor:
         if self.config.kill_switch and not self.state.kill_switch_active:
             self.trip_kill_switch("Configured kill switch is ON")
 
+    def reset(self) -> None:
+        """
+        Discard all risk state, including the kill switch.
+
+        Unlike reset_daily, this also clears the balance history. The
+        configured kill switch is re-applied.
+        """
+        self.state = RiskState()
+        if self.config.kill_switch:
+            self.trip_kill_switch("Configured kill switch is ON")
+
     def _check_circuit_breakers(self) -> None:
         """Check generic circuit breakers (loss limits, trade counts)."""
         if self.state.kill_switch_active:
@@ -78,6 +78,7 @@ class DailyRunner:
         self.level_store = LevelStore(
             rth_start=self.session_manager.rth_start_time,
             rth_end=self.session_manager.rth_end_time,
+            tick_size=self.config.symbols.es.tick_size,
         )
         self.interaction_detector = InteractionDetector(
             tick_size=self.config.symbols.es.tick_size,
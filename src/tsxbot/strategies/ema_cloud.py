@@ -22,7 +22,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from tsxbot.constants import SignalDirection
-from tsxbot.data.indicators import Bar, calculate_ema_series
+from tsxbot.data.indicators import Bar, calculate_ema
 from tsxbot.strategies.base import BaseStrategy, TradeSignal
 
 if TYPE_CHECKING:
@@ -198,16 +198,14 @@ class EMACloudStrategy(BaseStrategy):
             self.emas = None
             return
 
-        ema_5_series = calculate_ema_series(self.bars, cfg.fast_ema_short)
-        ema_12_series = calculate_ema_series(self.bars, cfg.fast_ema_long)
-        ema_34_series = calculate_ema_series(self.bars, cfg.trend_ema_short)
-        ema_50_series = calculate_ema_series(self.bars, cfg.trend_ema_long)
+        # Only the latest value of each EMA is used, so skip building full series
+        closes = [bar.close for bar in self.bars]
 
         self.emas = EMAValues(
-            ema_5=ema_5_series[-1],
-            ema_12=ema_12_series[-1],
-            ema_34=ema_34_series[-1],
-            ema_50=ema_50_series[-1],
+            ema_5=calculate_ema(closes, cfg.fast_ema_short),
+            ema_12=calculate_ema(closes, cfg.fast_ema_long),
+            ema_34=calculate_ema(closes, cfg.trend_ema_short),
+            ema_50=calculate_ema(closes, cfg.trend_ema_long),
         )
 
     def _determine_bias(self, close: Decimal) -> MarketBias:
@@ -219,7 +217,7 @@ class EMACloudStrategy(BaseStrategy):
 
         # Check if EMAs are flat (compressed)
         separation_pts = self.emas.trend_cloud_separation
-        min_separation = Decimal(str(cfg.min_cloud_separation_ticks)) * self.tick_size
+        min_separation = Decimal(cfg.min_cloud_separation_ticks) * self.tick_size
         if separation_pts < min_separation:
             return MarketBias.NEUTRAL
 
@@ -335,7 +333,7 @@ class EMACloudStrategy(BaseStrategy):
             return Decimal("0")
 
         cfg = self._get_cfg()
-        buffer = Decimal(str(cfg.stop_buffer_ticks)) * self.tick_size
+        buffer = Decimal(cfg.stop_buffer_ticks) * self.tick_size
 
         if self.bias == MarketBias.BULLISH:
             return self.emas.trend_cloud_bottom - buffer
@@ -129,9 +129,9 @@ class SessionManager:
         # the first condition catches it.
         return t >= self.rth_end_time
 
-    def time_until_rth_open(self) -> timedelta:
-        """Get duration until next RTH open."""
-        now = self.now()
+    def time_until_rth_open(self, dt: datetime | None = None) -> timedelta:
+        """Get duration from the given time (default now) until next RTH open."""
+        now = dt if dt is not None else self.now()
 
         # If currently in RTH, 0
         if self.is_rth(now):
@@ -169,12 +169,12 @@ class SessionManager:
 
         return candidates[0] - now
 
-    def time_until_flatten(self) -> timedelta:
-        """Get duration until current session flatten time."""
-        if not self.is_trading_allowed():
-            return timedelta(0)
+    def time_until_flatten(self, dt: datetime | None = None) -> timedelta:
+        """Get duration from the given time (default now) until session flatten time."""
+        now = dt if dt is not None else self.now()
 
-        now = self.now()
+        if not self.is_trading_allowed(now):
+            return timedelta(0)
         flatten_dt = now.replace(
             hour=self.flatten_time.hour, minute=self.flatten_time.minute, second=0, microsecond=0
         )
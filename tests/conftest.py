@@ -1 +1,75 @@
 """Pytest configuration and shared fixtures."""
+
+from decimal import Decimal, localcontext
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tsxbot.config_loader import RiskConfig, SessionConfig, SymbolsConfig, SymbolSpecConfig
+
+# Working precision for tests marked decimal_fast. Enough for ES/MES prices
+# and VWAP sums; production code keeps the default 28-digit context.
+_FAST_DECIMAL_PREC = 12
+
+try:
+    import uvloop
+except ImportError:  # Not installed, or unsupported platform (Windows)
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories():
+        """Run async tests on uvloop when it is available."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def _decimal_precision(request):
+    """Lower Decimal precision for the duration of decimal_fast tests."""
+    if request.node.get_closest_marker("decimal_fast") is None:
+        yield
+        return
+    with localcontext(prec=_FAST_DECIMAL_PREC):
+        yield
+
+
+@pytest.fixture(scope="session")
+def nyc_tz():
+    return ZoneInfo("America/New_York")
+
+
+# Config models are validated once per session. Tests must not mutate them;
+# use model_copy(update=...) for a variant.
+@pytest.fixture(scope="session")
+def symbols_config():
+    return SymbolsConfig(
+        primary="ES",
+        micros="MES",
+        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
+        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
+    )
+
+
+@pytest.fixture(scope="session")
+def risk_config():
+    return RiskConfig(
+        daily_loss_limit_usd=Decimal("500.00"),
+        max_loss_limit_usd=Decimal("1000.00"),  # Drawdown limit
+        max_risk_per_trade_usd=Decimal("200.00"),
+        max_contracts_es=2,
+        max_contracts_mes=10,
+        max_trades_per_day=5,
+        kill_switch=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def session_config():
+    return SessionConfig(
+        timezone="America/New_York",
+        rth_start="09:30",
+        rth_end="16:00",
+        flatten_time="15:55",
+        trading_days=[0, 1, 2, 3, 4],
+    )
@@ -8,46 +8,23 @@ import pytest
 
 from tsxbot.broker.models import OrderRequest
 from tsxbot.broker.sim import SimBroker
-from tsxbot.config_loader import (
-    AppConfig,
-    CommissionConfig,
-    ExecutionConfig,
-    RiskConfig,
-    SymbolsConfig,
-    SymbolSpecConfig,
-)
+from tsxbot.config_loader import AppConfig, CommissionConfig, ExecutionConfig
 from tsxbot.constants import OrderSide, OrderType
 from tsxbot.data.market_data import Tick
 from tsxbot.persistence.state_store import StateStore
 from tsxbot.risk.risk_governor import RiskGovernor
 
 
+# symbols_config and risk_config come from conftest.
 @pytest.fixture
-def symbols_config():
-    return SymbolsConfig(
-        primary="ES",
-        micros="MES",
-        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
-        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
-    )
-
-
-@pytest.fixture
-def risk_config():
-    return RiskConfig(
-        daily_loss_limit_usd=Decimal("500.0"),
-        max_loss_limit_usd=Decimal("1000.0"),
-        max_risk_per_trade_usd=Decimal("100.0"),
-        max_contracts_es=2,
-        max_contracts_mes=10,
-        max_trades_per_day=5,
-        kill_switch=False,
-    )
+def scenario_risk_config(risk_config):
+    # The scenarios were written against a 100 USD per-trade limit
+    return risk_config.model_copy(update={"max_risk_per_trade_usd": Decimal("100.0")})
 
 
 @pytest.fixture
-def risk_governor(risk_config, symbols_config):
-    return RiskGovernor(risk_config, symbols_config)
+def risk_governor(scenario_risk_config, symbols_config):
+    return RiskGovernor(scenario_risk_config, symbols_config)
 
 
 @pytest.fixture
@@ -69,7 +46,6 @@ def broker(symbols_config):
 class TestDailyLossLimit:
     """Test daily loss limit triggers kill switch."""
 
-    @pytest.mark.asyncio
     async def test_daily_loss_triggers_kill_switch(self, risk_governor, broker):
         """When daily P&L exceeds limit, trading should be blocked."""
         # Simulate loss that exceeds daily limit
@@ -82,7 +58,6 @@ class TestDailyLossLimit:
         assert can_trade is False
         assert "Daily loss limit" in reason or "Kill switch" in reason
 
-    @pytest.mark.asyncio
     async def test_near_limit_still_allows_trading(self, risk_governor):
         """Trading allowed when near but not over limit."""
         risk_governor.update_account_status(
@@ -97,7 +72,6 @@ class TestDailyLossLimit:
 class TestMaxTrades:
     """Test max trades per day limit."""
 
-    @pytest.mark.asyncio
     async def test_max_trades_blocks_new_entries(self, risk_governor):
         """After max trades, new entries should be blocked."""
         # Simulate 5 trades (at limit)
@@ -108,7 +82,6 @@ class TestMaxTrades:
         assert can_trade is False
         assert "trades" in reason.lower()
 
-    @pytest.mark.asyncio
     async def test_under_max_trades_allows_trading(self, risk_governor):
         """Trading allowed when under max trades."""
         for _ in range(4):
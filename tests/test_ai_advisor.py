@@ -6,6 +6,8 @@ import json
 from datetime import datetime
 from decimal import Decimal
 
+import pytest
+
 from tsxbot.ai.models import MarketContext, TradeAnalysis, TradeValidation
 from tsxbot.ai.prompts import POST_TRADE_SYSTEM_PROMPT, PRE_TRADE_SYSTEM_PROMPT
 
@@ -113,18 +115,20 @@ class TestPrompts:
         assert "lessons" in POST_TRADE_SYSTEM_PROMPT
 
 
+@pytest.fixture(scope="module")
+def disabled_advisor():
+    """Shared advisor with AI disabled; response parsing is stateless."""
+    from tsxbot.ai.advisor import AIAdvisor
+    from tsxbot.config_loader import OpenAIConfig
+
+    return AIAdvisor(OpenAIConfig(enabled=False))
+
+
 class TestAIAdvisorParsing:
     """Tests for AI response parsing."""
 
-    def test_parse_valid_json_response(self):
+    def test_parse_valid_json_response(self, disabled_advisor):
         """Test parsing a valid JSON response."""
-        from tsxbot.ai.advisor import AIAdvisor
-        from tsxbot.config_loader import OpenAIConfig
-
-        # Create advisor with disabled config (no API calls)
-        config = OpenAIConfig(enabled=False)
-        advisor = AIAdvisor(config)
-
         raw = json.dumps(
             {
                 "confidence": 8,
@@ -134,20 +138,14 @@ class TestAIAdvisorParsing:
             }
         )
 
-        result = advisor._parse_validation_response(raw, latency_ms=100)
+        result = disabled_advisor._parse_validation_response(raw, latency_ms=100)
 
         assert result.confidence == 8
         assert "Good setup" in result.observations
         assert result.latency_ms == 100
 
-    def test_parse_json_with_markdown_wrapper(self):
+    def test_parse_json_with_markdown_wrapper(self, disabled_advisor):
         """Test parsing JSON wrapped in markdown code block."""
-        from tsxbot.ai.advisor import AIAdvisor
-        from tsxbot.config_loader import OpenAIConfig
-
-        config = OpenAIConfig(enabled=False)
-        advisor = AIAdvisor(config)
-
         raw = """```json
 {
     "confidence": 7,
@@ -157,27 +155,43 @@ class TestAIAdvisorParsing:
 }
 ```"""
 
-        result = advisor._parse_validation_response(raw, latency_ms=200)
+        result = disabled_advisor._parse_validation_response(raw, latency_ms=200)
 
         assert result.confidence == 7
         assert "Volume" in result.observations[0]
 
-    def test_parse_invalid_json_returns_default(self):
+    def test_parse_invalid_json_returns_default(self, disabled_advisor):
         """Test graceful handling of invalid JSON."""
-        from tsxbot.ai.advisor import AIAdvisor
-        from tsxbot.config_loader import OpenAIConfig
-
-        config = OpenAIConfig(enabled=False)
-        advisor = AIAdvisor(config)
-
         raw = "This is not valid JSON at all"
 
-        result = advisor._parse_validation_response(raw, latency_ms=50)
+        result = disabled_advisor._parse_validation_response(raw, latency_ms=50)
 
         # Should return default confidence without raising
         assert result.confidence == 5
         assert "Parse error" in result.observations[0]
 
+    def test_parse_null_lists_as_empty(self, disabled_advisor):
+        """Null list fields parse as empty instead of falling back to the error default."""
+        raw = json.dumps({"confidence": 7, "observations": None, "risks": None})
+
+        result = disabled_advisor._parse_validation_response(raw, latency_ms=30)
+
+        assert result.confidence == 7
+        assert result.observations == []
+        assert result.risks == []
+        assert result.suggestions == []
+
+    def test_parse_repeated_response_returns_fresh_lists(self, disabled_advisor):
+        """Cached parses must not share mutable lists between results."""
+        raw = json.dumps({"confidence": 6, "observations": ["Range day"], "risks": []})
+
+        first = disabled_advisor._parse_validation_response(raw, latency_ms=10)
+        first.observations.append("mutated")
+        second = disabled_advisor._parse_validation_response(raw, latency_ms=20)
+
+        assert second.observations == ["Range day"]
+        assert second.latency_ms == 20
+
 
 class TestAIAdvisorAvailability:
     """Tests for advisor availability checks."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from decimal import Decimal
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import pytest
 
 from tsxbot.config_loader import (
     ConfigLoader,
+    SymbolsConfig,
     interpolate_env_vars,
     load_config,
     load_config_with_overrides,
@@ -18,6 +20,28 @@ from tsxbot.config_loader import (
 from tsxbot.constants import BrokerMode, StrategyName
 
 
+@pytest.fixture(scope="session")
+def write_config(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """
+    Return a helper that writes YAML content to a session-wide temp file.
+
+    Identical content is written only once per session. Tests that modify
+    the file on disk must use their own ``tmp_path`` instead.
+    """
+    config_dir = tmp_path_factory.mktemp("config")
+    written: dict[str, Path] = {}
+
+    def _write(content: str) -> Path:
+        path = written.get(content)
+        if path is None:
+            path = config_dir / f"config_{len(written)}.yaml"
+            path.write_text(content)
+            written[content] = path
+        return path
+
+    return _write
+
+
 class TestEnvVarInterpolation:
     """Tests for environment variable interpolation."""
 
@@ -77,11 +101,33 @@ class TestProcessConfigDict:
         result = process_config_dict(data)
         assert result["items"] == ["static", "list_value"]
 
+    def test_non_string_leaves_unchanged(self) -> None:
+        """Test that numbers, bools, None and '$'-free strings pass through."""
+        data = {"a": 1, "b": 2.5, "c": True, "d": None, "e": "plain", "f": [0, 1, "x"]}
+        assert process_config_dict(data) == data
+
+    def test_unchanged_subtrees_are_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that only subtrees containing interpolation are copied."""
+        monkeypatch.setenv("SHARED_VAR", "shared_value")
+        static = {"a": 1, "b": ["x", "y"]}
+        data = {"static": static, "dynamic": {"value": "${SHARED_VAR}"}}
+
+        result = process_config_dict(data)
+
+        assert result is not data
+        assert result["static"] is static
+        assert result["dynamic"]["value"] == "shared_value"
+        # Input is left untouched
+        assert data["dynamic"]["value"] == "${SHARED_VAR}"
+
+        no_vars = {"static": static}
+        assert process_config_dict(no_vars) is no_vars
+
 
 class TestConfigLoader:
     """Tests for ConfigLoader class."""
 
-    def test_load_valid_config(self, tmp_path: Path) -> None:
+    def test_load_valid_config(self, write_config: Callable[[str], Path]) -> None:
         """Test loading a valid configuration file."""
         config_content = """
 environment:
@@ -93,8 +139,7 @@ risk:
   daily_loss_limit_usd: 500
   max_trades_per_day: 10
 """
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
+        config_file = write_config(config_content)
 
         loader = ConfigLoader(config_file)
         config = loader.load()
@@ -110,10 +155,9 @@ risk:
         with pytest.raises(FileNotFoundError):
             loader.load()
 
-    def test_empty_config_uses_defaults(self, tmp_path: Path) -> None:
+    def test_empty_config_uses_defaults(self, write_config: Callable[[str], Path]) -> None:
         """Test that empty config file uses defaults."""
-        config_file = tmp_path / "empty.yaml"
-        config_file.write_text("")
+        config_file = write_config("")
 
         config = load_config(config_file)
 
@@ -141,34 +185,30 @@ risk:
 class TestConfigWithOverrides:
     """Tests for CLI override functionality."""
 
-    def test_dry_run_override(self, tmp_path: Path) -> None:
+    def test_dry_run_override(self, write_config: Callable[[str], Path]) -> None:
         """Test overriding dry_run via CLI."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("environment:\n  dry_run: false")
+        config_file = write_config("environment:\n  dry_run: false")
 
         config = load_config_with_overrides(config_file, dry_run=True)
         assert config.environment.dry_run is True
 
-    def test_strategy_override(self, tmp_path: Path) -> None:
+    def test_strategy_override(self, write_config: Callable[[str], Path]) -> None:
         """Test overriding strategy via CLI."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("strategy:\n  active: orb")
+        config_file = write_config("strategy:\n  active: orb")
 
         config = load_config_with_overrides(config_file, strategy="sweep_reclaim")
         assert config.strategy.active == StrategyName.SWEEP_RECLAIM
 
-    def test_broker_mode_override(self, tmp_path: Path) -> None:
+    def test_broker_mode_override(self, write_config: Callable[[str], Path]) -> None:
         """Test overriding broker mode via CLI."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("environment:\n  broker_mode: projectx")
+        config_file = write_config("environment:\n  broker_mode: projectx")
 
         config = load_config_with_overrides(config_file, broker_mode="sim")
         assert config.environment.broker_mode == BrokerMode.SIM
 
-    def test_multiple_overrides(self, tmp_path: Path) -> None:
+    def test_multiple_overrides(self, write_config: Callable[[str], Path]) -> None:
         """Test multiple CLI overrides together."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("")
+        config_file = write_config("")
 
         config = load_config_with_overrides(
             config_file,
@@ -185,26 +225,23 @@ class TestConfigWithOverrides:
 class TestConfigValidation:
     """Tests for configuration validation."""
 
-    def test_invalid_time_format(self, tmp_path: Path) -> None:
+    def test_invalid_time_format(self, write_config: Callable[[str], Path]) -> None:
         """Test validation of time format."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("session:\n  rth_start: '9:30'")  # Missing leading zero
+        config_file = write_config("session:\n  rth_start: '9:30'")  # Missing leading zero
 
         with pytest.raises(ValueError, match="HH:MM format"):
             load_config(config_file)
 
-    def test_invalid_trading_days(self, tmp_path: Path) -> None:
+    def test_invalid_trading_days(self, write_config: Callable[[str], Path]) -> None:
         """Test validation of trading days."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("session:\n  trading_days: [0, 7]")  # 7 is invalid
+        config_file = write_config("session:\n  trading_days: [0, 7]")  # 7 is invalid
 
         with pytest.raises(ValueError, match="0-6"):
             load_config(config_file)
 
-    def test_invalid_pullback_range(self, tmp_path: Path) -> None:
+    def test_invalid_pullback_range(self, write_config: Callable[[str], Path]) -> None:
         """Test validation of pullback range in BOS strategy."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
+        config_file = write_config("""
 strategy:
   bos_pullback:
     pullback_min_pct: 0.8
@@ -214,10 +251,9 @@ strategy:
         with pytest.raises(ValueError, match="pullback_min_pct"):
             load_config(config_file)
 
-    def test_negative_risk_value(self, tmp_path: Path) -> None:
+    def test_negative_risk_value(self, write_config: Callable[[str], Path]) -> None:
         """Test validation of negative risk values."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("risk:\n  max_contracts_es: -1")
+        config_file = write_config("risk:\n  max_contracts_es: -1")
 
         with pytest.raises(ValueError, match="non-negative"):
             load_config(config_file)
@@ -226,26 +262,31 @@ strategy:
 class TestAppConfigProperties:
     """Tests for AppConfig computed properties."""
 
-    def test_is_dry_run_property(self, tmp_path: Path) -> None:
+    def test_is_dry_run_property(self, write_config: Callable[[str], Path]) -> None:
         """Test is_dry_run property."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("environment:\n  dry_run: true")
+        config_file = write_config("environment:\n  dry_run: true")
 
         config = load_config(config_file)
         assert config.is_dry_run is True
 
-    def test_is_sim_mode_property(self, tmp_path: Path) -> None:
+    def test_is_sim_mode_property(self, write_config: Callable[[str], Path]) -> None:
         """Test is_sim_mode property."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("environment:\n  broker_mode: sim")
+        config_file = write_config("environment:\n  broker_mode: sim")
 
         config = load_config(config_file)
         assert config.is_sim_mode is True
 
-    def test_is_live_environment_property(self, tmp_path: Path) -> None:
+    def test_is_live_environment_property(self, write_config: Callable[[str], Path]) -> None:
         """Test is_live_environment property."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("projectx:\n  trading_environment: LIVE")
+        config_file = write_config("projectx:\n  trading_environment: LIVE")
 
         config = load_config(config_file)
         assert config.is_live_environment is True
+
+
+class TestSymbolsConfig:
+    """Tests for SymbolsConfig derived values."""
+
+    def test_multipliers(self) -> None:
+        """Test point multipliers are tick_value / tick_size per symbol."""
+        assert SymbolsConfig().multipliers == {"ES": Decimal("50"), "MES": Decimal("5")}
@@ -2,33 +2,47 @@
 
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tsxbot.config_loader import AppConfig
 from tsxbot.data.market_data import Tick
 from tsxbot.scheduler.daily_runner import DailyRunner
 
 
+class _Recorder:
+    """Minimal on_tick sink that records ticks without MagicMock overhead."""
+
+    def __init__(self):
+        self.calls = []
+
+    def on_tick(self, tick):
+        self.calls.append(tick)
+
+
 @pytest.fixture
 def mock_config():
-    config = MagicMock(spec=AppConfig)
-    config.session = MagicMock()
-    config.session.rth_start = "09:30"
-    config.session.rth_end = "16:00"
-    config.session.flatten_time = "15:59"
-    config.session.timezone = "America/New_York"
-    config.symbols = MagicMock()
-    config.symbols.es = MagicMock()
-    config.symbols.es.tick_size = 0.25
-    config.symbols.primary = "ES"
-    config.openai = MagicMock()
-    config.is_dry_run = True
-    return config
-
-
-@pytest.mark.asyncio
+    # Plain namespaces instead of MagicMock(spec=AppConfig): DailyRunner only
+    # reads these attributes, so there is nothing to record or assert on.
+    return SimpleNamespace(
+        session=SimpleNamespace(
+            rth_start="09:30",
+            rth_end="16:00",
+            flatten_time="15:59",
+            timezone="America/New_York",
+            trading_days=[0, 1, 2, 3, 4],
+        ),
+        symbols=SimpleNamespace(
+            es=SimpleNamespace(tick_size=Decimal("0.25")),
+            primary="ES",
+        ),
+        openai=None,
+        is_dry_run=True,
+    )
+
+
 async def test_daily_runner_tick_archival(mock_config):
     """Test that ticks are archived during processing."""
 
@@ -38,38 +52,46 @@ async def test_daily_runner_tick_archival(mock_config):
     # Initialize runner with mocked config
     runner = DailyRunner(config=mock_config, broker=broker, enable_ai=False)
 
-    # Mock components
-    runner.tick_archiver = MagicMock()
-    runner.level_store = MagicMock()
-    runner.alert_engine = MagicMock()
+    # Replace tick consumers with recorders
+    runner.tick_archiver = _Recorder()
+    runner.level_store = _Recorder()
+    runner.alert_engine = _Recorder()
 
     # Create a tick
-    tick = Tick(timestamp=datetime.now(), price=5000.0, volume=10, symbol="ES")
+    tick = Tick(timestamp=datetime(2024, 1, 2, 9, 30), price=5000.0, volume=10, symbol="ES")
 
     # Process tick
     await runner._process_tick(tick)
 
     # Verify archiver was called
-    runner.tick_archiver.on_tick.assert_called_once_with(tick)
-    runner.alert_engine.on_tick.assert_called_once_with(tick)
+    assert runner.tick_archiver.calls == [tick]
+    assert runner.tick_archiver.calls[0] is tick
+    assert runner.alert_engine.calls == [tick]
+    assert runner.level_store.calls == [tick]
     assert len(runner._bar_data) == 1
 
 
-@pytest.mark.asyncio
-async def test_daily_runner_ai_init(mock_config):
-    """Test AI initialization."""
-    with patch("tsxbot.ai.advisor.AIAdvisor") as mock_ai:
-        # Mock is_available as a property by assigning directly to valid boolean
-        # Note: We configure the instance returned by constructor
-        instance = mock_ai.return_value
-        instance.is_available = True
+class _AvailableAdvisor:
+    """AIAdvisor stand-in that reports itself as configured."""
 
-        runner = DailyRunner(config=mock_config, enable_ai=True)
-        assert runner.ai_advisor is not None
+    is_available = True
 
-    with patch("tsxbot.ai.advisor.AIAdvisor") as mock_ai:
-        instance = mock_ai.return_value
-        instance.is_available = False
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class _UnavailableAdvisor(_AvailableAdvisor):
+    """AIAdvisor stand-in without an API key."""
+
+    is_available = False
+
+
+async def test_daily_runner_ai_init(mock_config, monkeypatch):
+    """Test AI initialization."""
+    monkeypatch.setattr("tsxbot.ai.advisor.AIAdvisor", _AvailableAdvisor)
+    runner = DailyRunner(config=mock_config, enable_ai=True)
+    assert isinstance(runner.ai_advisor, _AvailableAdvisor)
 
-        runner = DailyRunner(config=mock_config, enable_ai=True)
-        assert runner.ai_advisor is None
+    monkeypatch.setattr("tsxbot.ai.advisor.AIAdvisor", _UnavailableAdvisor)
+    runner = DailyRunner(config=mock_config, enable_ai=True)
+    assert runner.ai_advisor is None
@@ -14,6 +14,7 @@ from tsxbot.config_loader import (
     SymbolsConfig,
     SymbolSpecConfig,
 )
+from tsxbot.constants import SignalDirection
 from tsxbot.data.indicators import Bar, calculate_ema, calculate_ema_series
 from tsxbot.strategies.ema_cloud import (
     EMACloudStrategy,
@@ -22,6 +23,9 @@ from tsxbot.strategies.ema_cloud import (
     StrategyState,
 )
 
+# Fixed bar timestamp; the EMA and signal logic under test never reads it
+_NOW = datetime(2024, 1, 2, 9, 30)
+
 # ============================================
 # EMA Calculation Tests
 # ============================================
@@ -62,7 +66,7 @@ class TestEMACalculation:
     def test_calculate_ema_series_length(self):
         """EMA series has same length as input."""
         bars = [
-            Bar(datetime.now(), Decimal("100"), Decimal("101"), Decimal("99"), Decimal("100"), 100)
+            Bar(_NOW, Decimal("100"), Decimal("101"), Decimal("99"), Decimal("100"), 100)
             for _ in range(10)
         ]
         result = calculate_ema_series(bars, period=5)
@@ -72,7 +76,7 @@ class TestEMACalculation:
         """EMA series has zeros for insufficient data."""
         bars = [
             Bar(
-                datetime.now(),
+                _NOW,
                 Decimal("100"),
                 Decimal("101"),
                 Decimal("99"),
@@ -88,6 +92,22 @@ class TestEMACalculation:
         # 5th value should be non-zero
         assert result[4] != Decimal("0")
 
+    def test_calculate_ema_matches_series_last_value(self):
+        """calculate_ema on closes equals the last value of the series."""
+        bars = [
+            Bar(
+                _NOW,
+                Decimal("100"),
+                Decimal("101"),
+                Decimal("99"),
+                Decimal(str(100 + (i % 3))),
+                100,
+            )
+            for i in range(20)
+        ]
+        closes = [bar.close for bar in bars]
+        assert calculate_ema(closes, period=5) == calculate_ema_series(bars, period=5)[-1]
+
 
 # ============================================
 # EMAValues Tests
@@ -219,171 +239,61 @@ class TestBiasDetection:
 
 
 # ============================================
-# Entry Logic Tests
+# Entry / Exit Logic Tests
 # ============================================
 
 
-class TestEntryLogic:
-    """Test entry signal generation."""
-
-    def test_no_entry_without_pullback(self, mock_config, mock_session):
-        """No entry if no pullback detected."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-        strategy.bias = MarketBias.BULLISH
-        strategy.state = StrategyState.WAITING_PULLBACK
-
-        # Bar above everything - no pullback
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5015"),
-            high=Decimal("5020"),
-            low=Decimal("5014"),
-            close=Decimal("5018"),
-            volume=1000,
-        )
-
-        is_pullback = strategy._is_pullback_into_fast_cloud(bar)
-        assert is_pullback is False
+@pytest.fixture(scope="module")
+def strategy_with_bullish_emas():
+    """
+    Long-biased strategy with the standard bullish EMA stack.
 
-    def test_pullback_detected(self, mock_config, mock_session):
-        """Pullback detected when bar touches fast cloud."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-        strategy.bias = MarketBias.BULLISH
-
-        # Bar low touched fast cloud top (5010)
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5015"),
-            high=Decimal("5016"),
-            low=Decimal("5009"),  # Below fast cloud top
-            close=Decimal("5012"),
-            volume=1000,
-        )
-
-        is_pullback = strategy._is_pullback_into_fast_cloud(bar)
-        assert is_pullback is True
-
-    def test_entry_candle_bullish(self, mock_config, mock_session):
-        """Entry candle valid when bullish close above fast cloud."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-        strategy.bias = MarketBias.BULLISH
-
-        # Bullish candle (close > open) closing above fast cloud
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5008"),
-            high=Decimal("5015"),
-            low=Decimal("5007"),
-            close=Decimal("5014"),  # Above fast cloud top (5010)
-            volume=1000,
-        )
-
-        is_entry = strategy._is_entry_candle(bar)
-        assert is_entry is True
-
-    def test_no_entry_bearish_candle_in_bullish_bias(self, mock_config, mock_session):
-        """No entry if candle is bearish in bullish bias."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-        strategy.bias = MarketBias.BULLISH
-
-        # Bearish candle (close < open)
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5015"),
-            high=Decimal("5016"),
-            low=Decimal("5010"),
-            close=Decimal("5012"),  # Close < Open
-            volume=1000,
-        )
-
-        is_entry = strategy._is_entry_candle(bar)
-        assert is_entry is False
-
-
-# ============================================
-# Exit Logic Tests
-# ============================================
-
-
-class TestExitLogic:
-    """Test exit signal generation."""
-
-    def test_exit_on_cloud_violation_long(self, mock_config, mock_session):
-        """Exit long when close below fast cloud."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-        strategy.entry_direction = MagicMock()
-        strategy.entry_direction.value = "long"
-
-        from tsxbot.constants import SignalDirection
-
-        strategy.entry_direction = SignalDirection.LONG
-
-        # Bar closes below fast cloud bottom (5008)
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5010"),
-            high=Decimal("5011"),
-            low=Decimal("5005"),
-            close=Decimal("5006"),  # Below fast cloud bottom
-            volume=1000,
-        )
-
-        is_exit = strategy._is_exit_condition(bar)
-        assert is_exit is True
-
-    def test_no_exit_above_cloud_long(self, mock_config, mock_session):
-        """No exit for long when still above fast cloud."""
-        strategy = EMACloudStrategy(mock_config, mock_session)
-        strategy.emas = EMAValues(
-            ema_5=Decimal("5010"),
-            ema_12=Decimal("5008"),
-            ema_34=Decimal("5000"),
-            ema_50=Decimal("4995"),
-        )
-
-        from tsxbot.constants import SignalDirection
+    Fast cloud 5008-5010, trend cloud 4995-5000. The predicates exercised
+    below only read strategy state, so one instance serves every row.
+    """
+    config = MagicMock()
+    config.strategy.ema_cloud = EMACloudStrategyConfig()
+    strategy = EMACloudStrategy(config, MagicMock())
+    strategy.emas = EMAValues(
+        ema_5=Decimal("5010"),
+        ema_12=Decimal("5008"),
+        ema_34=Decimal("5000"),
+        ema_50=Decimal("4995"),
+    )
+    strategy.bias = MarketBias.BULLISH
+    strategy.state = StrategyState.WAITING_PULLBACK
+    strategy.entry_direction = SignalDirection.LONG
+    return strategy
 
-        strategy.entry_direction = SignalDirection.LONG
 
-        # Bar closes above fast cloud
-        bar = Bar(
-            datetime.now(),
-            open=Decimal("5012"),
-            high=Decimal("5015"),
-            low=Decimal("5009"),
-            close=Decimal("5013"),  # Above fast cloud top
-            volume=1000,
-        )
+@pytest.mark.parametrize(
+    ("ohlc", "method", "expected"),
+    [
+        # Bar above everything - no pullback
+        (("5015", "5020", "5014", "5018"), "_is_pullback_into_fast_cloud", False),
+        # Bar low below fast cloud top (5010) - pullback
+        (("5015", "5016", "5009", "5012"), "_is_pullback_into_fast_cloud", True),
+        # Bullish candle closing above fast cloud - valid entry
+        (("5008", "5015", "5007", "5014"), "_is_entry_candle", True),
+        # Bearish candle (close < open) in bullish bias - no entry
+        (("5015", "5016", "5010", "5012"), "_is_entry_candle", False),
+        # Long closes below fast cloud bottom (5008) - exit
+        (("5010", "5011", "5005", "5006"), "_is_exit_condition", True),
+        # Long still above fast cloud - no exit
+        (("5012", "5015", "5009", "5013"), "_is_exit_condition", False),
+    ],
+    ids=[
+        "no_pullback",
+        "pullback_detected",
+        "entry_candle_bullish",
+        "no_entry_bearish_candle",
+        "exit_on_cloud_violation_long",
+        "no_exit_above_cloud_long",
+    ],
+)
+def test_signal_matrix(strategy_with_bullish_emas, ohlc, method, expected):
+    """Entry and exit predicates against the standard bullish EMA stack."""
+    open_, high, low, close = (Decimal(v) for v in ohlc)
+    bar = Bar(_NOW, open=open_, high=high, low=low, close=close, volume=1000)
 
-        is_exit = strategy._is_exit_condition(bar)
-        assert is_exit is False
+    assert getattr(strategy_with_bullish_emas, method)(bar) is expected
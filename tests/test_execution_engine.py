@@ -6,13 +6,7 @@ from decimal import Decimal
 import pytest
 
 from tsxbot.broker.sim import SimBroker
-from tsxbot.config_loader import (
-    CommissionConfig,
-    ExecutionConfig,
-    RiskConfig,
-    SymbolsConfig,
-    SymbolSpecConfig,
-)
+from tsxbot.config_loader import CommissionConfig, ExecutionConfig
 from tsxbot.constants import OrderSide, OrderStatus, OrderType, SignalDirection
 from tsxbot.data.market_data import Tick
 from tsxbot.execution.engine import ExecutionEngine
@@ -20,46 +14,52 @@ from tsxbot.risk.risk_governor import RiskGovernor
 from tsxbot.strategies.base import TradeSignal
 
 
-@pytest.fixture
-def symbols_config():
-    return SymbolsConfig(
-        primary="ES",
-        micros="MES",
-        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
-        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
-    )
-
+# symbols_config comes from conftest. Everything else is built once per
+# module; stateful objects are reset between tests by the autouse fixture below.
+@pytest.fixture(scope="module")
+def engine_risk_config(risk_config):
+    # The engine tests were written against a 100 USD per-trade limit
+    return risk_config.model_copy(update={"max_risk_per_trade_usd": Decimal("100.00")})
 
-@pytest.fixture
-def risk_config():
-    return RiskConfig(
-        daily_loss_limit_usd=Decimal("500.00"),
-        max_trades_per_day=5,
-        max_risk_per_trade_usd=Decimal("100.00"),
-    )
 
-
-@pytest.fixture
-def broker(symbols_config):
+@pytest.fixture(scope="module")
+def execution_config():
     # Zero slippage and zero commission for predictable test results
-    exec_config = ExecutionConfig(
+    return ExecutionConfig(
         slippage_ticks=0,
         commissions=CommissionConfig(es_round_turn=Decimal("0.00"), mes_round_turn=Decimal("0.00")),
     )
-    return SimBroker(symbols_config, execution_config=exec_config)
 
 
-@pytest.fixture
-def risk_governor(risk_config, symbols_config):
-    return RiskGovernor(risk_config, symbols_config)
+@pytest.fixture(scope="module")
+def broker(symbols_config, execution_config):
+    return SimBroker(symbols_config, execution_config=execution_config)
+
 
+@pytest.fixture(scope="module")
+def risk_governor(engine_risk_config, symbols_config):
+    return RiskGovernor(engine_risk_config, symbols_config)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def engine(broker, risk_governor, symbols_config):
     return ExecutionEngine(broker, risk_governor, symbols_config)
 
 
-@pytest.mark.asyncio
+def _reset_all(engine, broker, risk_governor):
+    broker.reset()
+    engine.reset()
+    risk_governor.reset()
+
+
+@pytest.fixture(autouse=True)
+def _reset(engine, broker, risk_governor):
+    # Before as well as after, so no test depends on construction order
+    _reset_all(engine, broker, risk_governor)
+    yield
+    _reset_all(engine, broker, risk_governor)
+
+
 async def test_signal_flow_buyside(engine, broker):
     # 1. Start Signal (Long ES)
     now = datetime.now()
@@ -122,7 +122,6 @@ async def test_signal_flow_buyside(engine, broker):
     assert stop_order.status == OrderStatus.CANCELLED
 
 
-@pytest.mark.asyncio
 async def test_risk_rejection(engine, broker, risk_governor):
     # Trip kill switch manually
     risk_governor.trip_kill_switch("Test")
@@ -136,3 +135,29 @@ async def test_risk_rejection(engine, broker, risk_governor):
     # No orders placed
     orders = await broker.get_orders()
     assert len(orders) == 0
+
+
+async def test_engine_reset_clears_tracking(engine, broker):
+    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
+    signal = TradeSignal(
+        symbol="ES",
+        direction=SignalDirection.LONG,
+        timestamp=datetime.now(),
+        quantity=1,
+        entry_type=OrderType.MARKET,
+        stop_ticks=8,
+        target_ticks=16,
+    )
+    await engine.process_signal(signal)
+    engine.accumulated_lessons.append("Lesson")
+    engine._last_ai_confidence = 7
+    assert engine.active_trades
+    assert engine.order_map
+
+    engine.reset()
+
+    assert engine.active_trades == {}
+    assert engine.order_map == {}
+    assert engine.accumulated_lessons == []
+    assert engine._last_ai_confidence is None
+    assert engine._last_market_context is None
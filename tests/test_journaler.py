@@ -10,14 +10,17 @@ from tsxbot.journal.journaler import Journaler
 from tsxbot.journal.models import Decision
 
 
-@pytest.mark.asyncio
-async def test_journaler_lifecycle(tmp_path):
-    db_path = tmp_path / "test.db"
-    journal = Journaler(db_path)
+async def test_journaler_lifecycle():
+    # Shared in-memory DB: no disk I/O. The keeper connection holds the
+    # database alive between the journaler's short-lived connections.
+    db_uri = "file:journaler_lifecycle?mode=memory&cache=shared"
+    conn = sqlite3.connect(db_uri, uri=True)
+    journal = Journaler(db_uri)
 
     # 1. Initialize
     await journal.initialize()
-    assert db_path.exists()
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "runs" in tables
 
     # 2. Start Run
     config = AppConfig()  # Default config
@@ -39,7 +42,6 @@ async def test_journaler_lifecycle(tmp_path):
     await journal.close()
 
     # 5. Verify Data
-    conn = sqlite3.connect(db_path)
     cur = conn.cursor()
 
     # Check Run
@@ -56,3 +58,13 @@ async def test_journaler_lifecycle(tmp_path):
     assert "foo" in decs[0][2]
 
     conn.close()
+
+
+async def test_journaler_initialize_creates_db_file(tmp_path):
+    db_path = tmp_path / "nested" / "test.db"
+    journal = Journaler(db_path)
+
+    await journal.initialize()
+    await journal.close()
+
+    assert db_path.exists()
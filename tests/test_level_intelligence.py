@@ -1,8 +1,8 @@
 """Tests for Level Intelligence components."""
 
+from dataclasses import replace
 from datetime import date, datetime, time
 from decimal import Decimal
-from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -18,12 +18,37 @@ from tsxbot.intelligence.interaction_detector import (
     InteractionType,
     LevelInteraction,
 )
-from tsxbot.intelligence.level_store import LevelStore, SessionLevels
+from tsxbot.intelligence.level_store import LevelStore, SessionLevels, _warn_off_grid
 
+# SessionLevels is mutable; tests derive their own copy with replace()
+_BASE_LEVELS = SessionLevels(date=date(2024, 1, 3), symbol="ES")
 
-@pytest.fixture
-def nyc_tz():
-    return ZoneInfo("America/New_York")
+
+@pytest.fixture(scope="module")
+def tick_batches(nyc_tz):
+    """Named tick sequences built once per module (Tick is frozen, so sharing is safe)."""
+
+    def tick(hour: int, minute: int, price: str, volume: int = 100) -> Tick:
+        return Tick(
+            symbol="ES",
+            timestamp=datetime(2024, 1, 3, hour, minute, tzinfo=nyc_tz),
+            price=Decimal(price),
+            volume=volume,
+        )
+
+    return {
+        # First 30 minutes: high 5010, low 4990
+        "or_window": [
+            tick(9, 30, "5000.00"),
+            tick(9, 35, "5010.00"),
+            tick(9, 45, "4990.00"),
+            tick(9, 59, "5005.00"),
+        ],
+        "post_or": [tick(10, 1, "5002.00")],
+        # Price 100 @ volume 10, Price 110 @ volume 10
+        "vwap": [tick(9, 30, "100", volume=10), tick(9, 31, "110", volume=10)],
+        "pre_market": [tick(9, 0, "5000.00")],
+    }
 
 
 # ============================================================================
@@ -47,39 +72,12 @@ class TestLevelStore:
         assert levels.pdl == Decimal("5050.00")
         assert levels.pdc == Decimal("5075.00")
 
-    def test_opening_range_formation(self, nyc_tz):
+    def test_opening_range_formation(self, tick_batches):
         """Test OR high/low is computed in first 30 minutes."""
         store = LevelStore(opening_range_minutes=30)
 
         # Simulate ticks in first 30 min
-        ticks = [
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 30, tzinfo=nyc_tz),
-                price=Decimal("5000.00"),
-                volume=100,
-            ),
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 35, tzinfo=nyc_tz),
-                price=Decimal("5010.00"),
-                volume=100,
-            ),
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 45, tzinfo=nyc_tz),
-                price=Decimal("4990.00"),
-                volume=100,
-            ),
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 59, tzinfo=nyc_tz),
-                price=Decimal("5005.00"),
-                volume=100,
-            ),
-        ]
-
-        for tick in ticks:
+        for tick in tick_batches["or_window"]:
             store.on_tick(tick)
 
         levels = store.get_current_levels()
@@ -88,56 +86,66 @@ class TestLevelStore:
         assert levels.or_formed is False  # Still in OR window
 
         # Tick after OR window
-        post_or_tick = Tick(
-            symbol="ES",
-            timestamp=datetime(2024, 1, 3, 10, 1, tzinfo=nyc_tz),
-            price=Decimal("5002.00"),
-            volume=100,
-        )
-        store.on_tick(post_or_tick)
+        for tick in tick_batches["post_or"]:
+            store.on_tick(tick)
 
         levels = store.get_current_levels()
         assert levels.or_formed is True
         assert levels.orh == Decimal("5010.00")  # Should not change
 
-    def test_vwap_calculation(self, nyc_tz):
+    def test_vwap_calculation(self, tick_batches):
         """Test VWAP is computed correctly."""
         store = LevelStore()
 
-        # Price 100 @ volume 10, Price 110 @ volume 10
         # VWAP = (100*10 + 110*10) / 20 = 2100 / 20 = 105
-        ticks = [
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 30, tzinfo=nyc_tz),
-                price=Decimal("100"),
-                volume=10,
-            ),
-            Tick(
-                symbol="ES",
-                timestamp=datetime(2024, 1, 3, 9, 31, tzinfo=nyc_tz),
-                price=Decimal("110"),
-                volume=10,
-            ),
-        ]
-
-        for tick in ticks:
+        for tick in tick_batches["vwap"]:
             store.on_tick(tick)
 
         levels = store.get_current_levels()
         assert levels.vwap == Decimal("105")
 
-    def test_outside_rth_ignored(self, nyc_tz):
+    def test_vwap_fractional_ticks(self, nyc_tz):
+        """Test VWAP is exact for quarter-point prices."""
+        store = LevelStore(tick_size=Decimal("0.25"))
+
+        # (5000.25*3 + 5000.75*2) / 5 = 5000.45
+        for minute, price, volume in ((30, "5000.25", 3), (31, "5000.75", 2)):
+            store.on_tick(
+                Tick(
+                    symbol="ES",
+                    timestamp=datetime(2024, 1, 3, 9, minute, tzinfo=nyc_tz),
+                    price=Decimal(price),
+                    volume=volume,
+                )
+            )
+
+        assert store.get_current_levels().vwap == Decimal("5000.45")
+
+    def test_vwap_off_grid_price_is_exact(self, nyc_tz, caplog):
+        """Test an off-grid price is summed exactly and logged once, not rounded to a tick."""
+        _warn_off_grid.cache_clear()
+        store = LevelStore(tick_size=Decimal("0.25"))
+
+        # (5000.25 + 5000.10 * 2) / 3 = 5000.15; rounding 5000.10 to 5000.00 would give 5000.083...
+        for minute, price in ((30, "5000.25"), (31, "5000.10"), (32, "5000.10")):
+            store.on_tick(
+                Tick(
+                    symbol="ES",
+                    timestamp=datetime(2024, 1, 3, 9, minute, tzinfo=nyc_tz),
+                    price=Decimal(price),
+                    volume=1,
+                )
+            )
+
+        assert store.get_current_levels().vwap == Decimal("5000.15")
+        assert caplog.text.count("not on the 0.25 tick grid") == 1
+
+    def test_outside_rth_ignored(self, tick_batches):
         """Test that pre-market ticks don't update levels."""
         store = LevelStore()
 
-        pre_market = Tick(
-            symbol="ES",
-            timestamp=datetime(2024, 1, 3, 9, 0, tzinfo=nyc_tz),
-            price=Decimal("5000.00"),
-            volume=100,
-        )
-        store.on_tick(pre_market)
+        for tick in tick_batches["pre_market"]:
+            store.on_tick(tick)
 
         levels = store.get_current_levels()
         assert levels.orh is None
@@ -150,16 +158,13 @@ class TestLevelStore:
 # ============================================================================
 
 
+@pytest.mark.decimal_fast
 class TestInteractionDetector:
     def test_touch_detection(self, nyc_tz):
         """Test touch is detected within threshold."""
         detector = InteractionDetector(tick_size=Decimal("0.25"), touch_threshold_ticks=2)
 
-        levels = SessionLevels(
-            date=date(2024, 1, 3),
-            symbol="ES",
-            pdh=Decimal("5100.00"),
-        )
+        levels = replace(_BASE_LEVELS, pdh=Decimal("5100.00"))
         detector.update_levels(levels)
 
         # First bar: establish position below level
@@ -187,11 +192,7 @@ class TestInteractionDetector:
             hold_bars=3,
         )
 
-        levels = SessionLevels(
-            date=date(2024, 1, 3),
-            symbol="ES",
-            pdh=Decimal("5100.00"),
-        )
+        levels = replace(_BASE_LEVELS, pdh=Decimal("5100.00"))
         detector.update_levels(levels)
 
         # Start below, break above
@@ -214,22 +215,40 @@ class TestInteractionDetector:
         assert len(break_holds) >= 1
         assert break_holds[0].level_name == "pdh"
 
+    def test_touch_confirms_after_reject_bars(self, nyc_tz):
+        """Test due touches are confirmed and later ones stay pending."""
+        detector = InteractionDetector(tick_size=Decimal("0.25"), reject_bars=2)
+        detector.update_levels(
+            replace(_BASE_LEVELS, pdh=Decimal("5100.00"), pdl=Decimal("5000.00"))
+        )
+
+        detector.on_bar_close(Decimal("5050.00"), datetime(2024, 1, 3, 10, 0, tzinfo=nyc_tz))
+        detector.on_bar_close(Decimal("5099.75"), datetime(2024, 1, 3, 10, 1, tzinfo=nyc_tz))
+        detector.on_bar_close(Decimal("5000.25"), datetime(2024, 1, 3, 10, 2, tzinfo=nyc_tz))
+
+        # PDH touch is due; price is far away, so it upgrades to REJECT
+        interactions = detector.on_bar_close(
+            Decimal("5000.25"), datetime(2024, 1, 3, 10, 3, tzinfo=nyc_tz)
+        )
+
+        assert [(i.level_name, i.interaction_type) for i in interactions] == [
+            ("pdh", InteractionType.REJECT)
+        ]
+        assert [p[0].level_name for p in detector._pending] == ["pdl"]
+
 
 # ============================================================================
 # FeatureSnapshot Tests
 # ============================================================================
 
 
+@pytest.mark.decimal_fast
 class TestFeatureEngine:
     def test_vwap_context(self, nyc_tz):
         """Test VWAP distance and side calculation."""
         engine = FeatureEngine(tick_size=Decimal("0.25"))
 
-        levels = SessionLevels(
-            date=date(2024, 1, 3),
-            symbol="ES",
-            vwap=Decimal("5050.00"),
-        )
+        levels = replace(_BASE_LEVELS, vwap=Decimal("5050.00"))
 
         snapshot = engine.compute_snapshot(
             price=Decimal("5055.00"),
@@ -244,12 +263,7 @@ class TestFeatureEngine:
         """Test position relative to opening range."""
         engine = FeatureEngine()
 
-        levels = SessionLevels(
-            date=date(2024, 1, 3),
-            symbol="ES",
-            orh=Decimal("5060.00"),
-            orl=Decimal("5040.00"),
-        )
+        levels = replace(_BASE_LEVELS, orh=Decimal("5060.00"), orl=Decimal("5040.00"))
 
         # Price within OR
         snapshot = engine.compute_snapshot(
@@ -272,20 +286,10 @@ class TestFeatureEngine:
         """Test trend up regime is classified correctly."""
         engine = FeatureEngine()
 
-        levels = SessionLevels(
-            date=date(2024, 1, 3),
-            symbol="ES",
-            orh=Decimal("5060.00"),
-            orl=Decimal("5040.00"),
-        )
+        levels = replace(_BASE_LEVELS, orh=Decimal("5060.00"), orl=Decimal("5040.00"))
 
         # Feed rising prices to establish uptrend
-        for i in range(25):
-            engine.compute_snapshot(
-                price=Decimal("5050") + Decimal(i),
-                timestamp=datetime(2024, 1, 3, 10, i, tzinfo=nyc_tz),
-                levels=levels,
-            )
+        engine.warmup(Decimal("5050") + Decimal(i) for i in range(25))
 
         # Final snapshot should show trend up
         snapshot = engine.compute_snapshot(
@@ -297,6 +301,24 @@ class TestFeatureEngine:
         assert snapshot.regime == RegimeType.TREND_UP
         assert snapshot.position_in_or == "above"
 
+    def test_warmup_matches_scalar_path(self, nyc_tz):
+        """Bulk warmup leaves the same EMA state as per-price snapshots."""
+        prices = [Decimal("5050") + Decimal(i) for i in range(25)]
+
+        scalar = FeatureEngine()
+        for i, price in enumerate(prices):
+            scalar.compute_snapshot(
+                price=price,
+                timestamp=datetime(2024, 1, 3, 10, i, tzinfo=nyc_tz),
+            )
+
+        bulk = FeatureEngine()
+        bulk.warmup(prices)
+
+        assert bulk._ema_fast == scalar._ema_fast
+        assert bulk._ema_slow == scalar._ema_slow
+        assert bulk._price_count == scalar._price_count
+
     def test_time_of_day(self, nyc_tz):
         """Test time of day classification."""
         engine = FeatureEngine()
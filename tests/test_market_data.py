@@ -0,0 +1,38 @@
+"""Tests for market data helpers."""
+
+from decimal import Decimal
+
+import pytest
+
+from tsxbot.data.market_data import price_to_decimal
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (5750.25, "5750.25"),
+        ("5750.25", "5750.25"),
+        (5750, "5750"),
+    ],
+    ids=["float", "str", "int"],
+)
+def test_price_to_decimal(raw, expected):
+    result = price_to_decimal(raw)
+
+    assert isinstance(result, Decimal)
+    assert str(result) == expected
+
+
+def test_price_to_decimal_caches_int_and_float_separately():
+    price_to_decimal.cache_clear()
+
+    as_int = price_to_decimal(5750)
+    as_float = price_to_decimal(5750.0)
+
+    # 5750 == 5750.0, but typed=True keeps one entry per input type
+    assert price_to_decimal.cache_info().currsize == 2
+    assert str(as_int) == "5750"
+    assert str(as_float) == "5750.0"
+
+    price_to_decimal(5750)
+    assert price_to_decimal.cache_info().hits == 1
@@ -1,10 +1,12 @@
+from collections import namedtuple
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
 
 import pytest
 
 from tsxbot.scheduler.alert_engine import Alert, AlertConfig, AlertEngine, AlertType
 
+TickStub = namedtuple("TickStub", ["timestamp", "price"])
+
 
 def test_large_move_alert_disabled():
     """Test that large move alerts are disabled by default."""
@@ -12,13 +14,8 @@ def test_large_move_alert_disabled():
     engine = AlertEngine(config=config)
 
     # Simulate a large move
-    tick1 = MagicMock()
-    tick1.timestamp = datetime.now()
-    tick1.price = 100
-
-    tick2 = MagicMock()
-    tick2.timestamp = datetime.now() + timedelta(minutes=1)
-    tick2.price = 102  # 2% move
+    tick1 = TickStub(datetime.now(), 100)
+    tick2 = TickStub(datetime.now() + timedelta(minutes=1), 102)  # 2% move
 
     alert1 = engine.on_tick(tick1)
     alert2 = engine.on_tick(tick2)
@@ -1,8 +1,7 @@
 """Tests for ORB Strategy."""
 
-from datetime import datetime
+from datetime import date, datetime, time
 from decimal import Decimal
-from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -21,11 +20,6 @@ from tsxbot.strategies.orb import ORBStrategy
 from tsxbot.time.session_manager import SessionManager
 
 
-@pytest.fixture
-def nyc_tz():
-    return ZoneInfo("America/New_York")
-
-
 @pytest.fixture
 def app_config():
     return AppConfig(
@@ -63,19 +57,48 @@ def strategy(app_config, session_manager):
     return ORBStrategy(app_config, session_manager)
 
 
-def create_tick(price_str: str, time_str: str, tz) -> Tick:
+# Tick times on the test session date (2024-01-03)
+_SESSION_DATE = date(2024, 1, 3)
+T_0929_59 = time(9, 29, 59)
+T_0930 = time(9, 30)
+T_0932 = time(9, 32)
+T_0934 = time(9, 34)
+T_0935 = time(9, 35)
+T_0935_01 = time(9, 35, 1)
+T_0936 = time(9, 36)
+T_0936_05 = time(9, 36, 5)
+T_0936_10 = time(9, 36, 10)
+T_0940 = time(9, 40)
+T_0940_05 = time(9, 40, 5)
+
+
+def create_tick(price_str: str, at: time, tz) -> Tick:
     """Helper to create tick."""
-    dt = datetime.strptime(f"2024-01-03 {time_str}", "%Y-%m-%d %H:%M:%S")
-    dt = dt.replace(tzinfo=tz)
-    return Tick(symbol="ES", timestamp=dt, price=Decimal(price_str), volume=1)
+    return Tick(
+        symbol="ES",
+        timestamp=datetime.combine(_SESSION_DATE, at, tzinfo=tz),
+        price=Decimal(price_str),
+        volume=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def range_ticks(nyc_tz):
+    """Ticks forming a 4995 - 5005 opening range, plus one that closes the window."""
+    return [
+        create_tick("5000.00", T_0930, nyc_tz),
+        create_tick("5005.00", T_0932, nyc_tz),
+        create_tick("4995.00", T_0934, nyc_tz),
+        create_tick("5000.00", T_0935_01, nyc_tz),
+    ]
 
 
 class TestORBStrategy:
     def test_range_formation(self, strategy, nyc_tz):
         # 09:30: Start
-        t1 = create_tick("5000.00", "09:30:00", nyc_tz)
-        t2 = create_tick("5005.00", "09:32:00", nyc_tz)  # High
-        t3 = create_tick("4995.00", "09:34:00", nyc_tz)  # Low
+        t1 = create_tick("5000.00", T_0930, nyc_tz)
+        t2 = create_tick("5005.00", T_0932, nyc_tz)  # High
+        t3 = create_tick("4995.00", T_0934, nyc_tz)  # Low
 
         strategy.on_tick(t1)
         strategy.on_tick(t2)
@@ -86,65 +109,58 @@ class TestORBStrategy:
         assert strategy.range_low == Decimal("4995.00")
 
         # 09:35:00: Range End (inclusive in logic: <= range_end)
-        t4 = create_tick("5002.00", "09:35:00", nyc_tz)
+        t4 = create_tick("5002.00", T_0935, nyc_tz)
         strategy.on_tick(t4)
         assert strategy.range_formed is False
 
         # 09:35:01: Breakout window opens
-        t5 = create_tick("5003.00", "09:35:01", nyc_tz)
+        t5 = create_tick("5003.00", T_0935_01, nyc_tz)
         strategy.on_tick(t5)
         assert strategy.range_formed is True
 
-    def test_breakout_long(self, strategy, nyc_tz):
-        # Establish range 4995 - 5005
-        # Range ends 09:35:00
-        strategy.on_tick(create_tick("5000.00", "09:30:00", nyc_tz))
-        strategy.on_tick(create_tick("5005.00", "09:32:00", nyc_tz))
-        strategy.on_tick(create_tick("4995.00", "09:34:00", nyc_tz))
-
-        # Trigger range formed
-        strategy.on_tick(create_tick("5000.00", "09:35:01", nyc_tz))
+    def test_breakout_long(self, strategy, nyc_tz, range_ticks):
+        # Establish range 4995 - 5005 (range ends 09:35:00, last tick forms it)
+        for tick in range_ticks:
+            strategy.on_tick(tick)
         assert strategy.range_formed is True
 
         # Buffer = 2 ticks = 0.50
         # High = 5005.00 + 0.50 = 5005.50 to trigger
 
         # Test 5005.25 (1 tick above, no trigger)
-        signals = strategy.on_tick(create_tick("5005.25", "09:36:00", nyc_tz))
+        signals = strategy.on_tick(create_tick("5005.25", T_0936, nyc_tz))
         assert len(signals) == 0
 
         # Test 5005.50 (Trigger)
-        signals = strategy.on_tick(create_tick("5005.50", "09:36:05", nyc_tz))
+        signals = strategy.on_tick(create_tick("5005.50", T_0936_05, nyc_tz))
         assert len(signals) == 1
         assert signals[0].direction == SignalDirection.LONG
         assert signals[0].reason.startswith("ORB High Breakout")
 
         # Test 5006.00 (Should not trigger again due to latch)
-        signals = strategy.on_tick(create_tick("5006.00", "09:36:10", nyc_tz))
+        signals = strategy.on_tick(create_tick("5006.00", T_0936_10, nyc_tz))
         assert len(signals) == 0
 
-    def test_breakout_short(self, strategy, nyc_tz):
+    def test_breakout_short(self, strategy, nyc_tz, range_ticks):
         # Establish range 4995 - 5005
-        strategy.on_tick(create_tick("5000.00", "09:30:00", nyc_tz))
-        strategy.on_tick(create_tick("5005.00", "09:32:00", nyc_tz))
-        strategy.on_tick(create_tick("4995.00", "09:34:00", nyc_tz))
-        strategy.on_tick(create_tick("5000.00", "09:35:01", nyc_tz))
+        for tick in range_ticks:
+            strategy.on_tick(tick)
 
         # Buffer = 0.50
         # Low = 4995.00 - 0.50 = 4994.50 to trigger
 
         # Test 4994.75 (No trigger)
-        signals = strategy.on_tick(create_tick("4994.75", "09:40:00", nyc_tz))
+        signals = strategy.on_tick(create_tick("4994.75", T_0940, nyc_tz))
         assert len(signals) == 0
 
         # Test 4994.50 (Trigger)
-        signals = strategy.on_tick(create_tick("4994.50", "09:40:05", nyc_tz))
+        signals = strategy.on_tick(create_tick("4994.50", T_0940_05, nyc_tz))
         assert len(signals) == 1
         assert signals[0].direction == SignalDirection.SHORT
 
     def test_outside_rth(self, strategy, nyc_tz):
         # Pre-market tick
-        signals = strategy.on_tick(create_tick("5000.00", "09:29:59", nyc_tz))
+        signals = strategy.on_tick(create_tick("5000.00", T_0929_59, nyc_tz))
         assert len(signals) == 0
 
         # No range update
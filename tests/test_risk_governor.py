@@ -6,147 +6,127 @@ from decimal import Decimal
 
 import pytest
 
-from tsxbot.config_loader import RiskConfig, SymbolsConfig, SymbolSpecConfig
 from tsxbot.risk.risk_governor import RiskGovernor
 
+# risk_config and symbols_config come from conftest and are shared; copy before changing.
 
-@pytest.fixture
-def risk_config():
-    return RiskConfig(
-        daily_loss_limit_usd=500.0,
-        max_loss_limit_usd=1000.0,  # Drawdown limit
-        max_risk_per_trade_usd=200.0,
-        max_contracts_es=2,
-        max_contracts_mes=10,
-        max_trades_per_day=5,
-        kill_switch=False,
-    )
-
-
-@pytest.fixture
-def symbols_config():
-    return SymbolsConfig(
-        primary="ES",
-        micros="MES",
-        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
-        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
-    )
-
-
-class TestRiskGovernor:
-    def test_initial_state(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
-        assert governor.state.trade_count == 0
-        assert governor.state.kill_switch_active is False
-        allowed, _ = governor.can_trade()
-        assert allowed is True
 
-    def test_daily_loss_limit(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
+def test_initial_state(risk_config, symbols_config):
+    governor = RiskGovernor(risk_config, symbols_config)
+    assert governor.state.trade_count == 0
+    assert governor.state.kill_switch_active is False
+    allowed, _ = governor.can_trade()
+    assert allowed is True
 
-        # Loss of 400 (Limit 500)
-        governor.update_account_status(Decimal("49600"), Decimal("-400"))
-        allowed, _ = governor.can_trade()
-        assert allowed is True
 
+@pytest.mark.parametrize(
+    ("updates", "expect_kill", "drawdown"),
+    [
+        # Loss of 400 (Limit 500)
+        ([("49600", "-400")], False, "0"),
         # Loss of 501 (Limit 500)
-        governor.update_account_status(Decimal("49499"), Decimal("-501"))
-        assert governor.state.kill_switch_active is True
-        allowed, reason = governor.can_trade()
-        assert allowed is False
+        ([("49499", "-501")], True, "0"),
+        # HWM 51000, drawdown 900 (Limit 1000)
+        ([("50000", "0"), ("51000", "1000"), ("50100", "100")], False, "900"),
+        # HWM 51000, drawdown 1100
+        ([("50000", "0"), ("51000", "1000"), ("49900", "-100")], True, "1100"),
+    ],
+    ids=["daily_loss_ok", "daily_loss_hit", "drawdown_ok", "drawdown_hit"],
+)
+def test_loss_limits(risk_config, symbols_config, updates, expect_kill, drawdown):
+    governor = RiskGovernor(risk_config, symbols_config)
+
+    for balance, pnl in updates:
+        governor.update_account_status(Decimal(balance), Decimal(pnl))
+
+    assert governor.state.current_drawdown == Decimal(drawdown)
+    assert governor.state.kill_switch_active is expect_kill
+    allowed, reason = governor.can_trade()
+    assert allowed is not expect_kill
+    if expect_kill:
         assert "Kill switch active" in reason
 
-    def test_drawdown_limit(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
 
-        # Initial balance 50000 -> HWM
-        governor.update_account_status(Decimal("50000"), Decimal("0"))
+def test_max_trades_per_day(risk_config, symbols_config):
+    governor = RiskGovernor(risk_config, symbols_config)
 
-        # Profit -> HWM 51000
-        governor.update_account_status(Decimal("51000"), Decimal("1000"))
-        assert governor.state.high_water_mark == Decimal("51000")
-
-        # Drawdown 900 (Limit 1000) -> Balance 50100
-        governor.update_account_status(Decimal("50100"), Decimal("100"))
-        assert governor.state.current_drawdown == Decimal("900")
+    # Record 4 trades (Limit 5)
+    for _ in range(4):
+        governor.record_trade_execution()
         allowed, _ = governor.can_trade()
         assert allowed is True
 
-        # Drawdown 1100 -> Balance 49900
-        governor.update_account_status(Decimal("49900"), Decimal("-100"))
-        assert governor.state.current_drawdown == Decimal("1100")
-        assert governor.state.kill_switch_active is True
-        allowed, _ = governor.can_trade()
-        assert allowed is False
+    # Record 5th trade
+    governor.record_trade_execution()
+    assert governor.state.trade_count == 5
 
-    def test_max_trades_per_day(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
+    # Next check should fail
+    allowed, reason = governor.can_trade()
+    assert allowed is False
+    assert "Max trades" in reason
+    # But kill switch NOT active (soft stop)
+    assert governor.state.kill_switch_active is False
 
-        # Record 4 trades (Limit 5)
-        for _ in range(4):
-            governor.record_trade_execution()
-            allowed, _ = governor.can_trade()
-            assert allowed is True
 
-        # Record 5th trade
-        governor.record_trade_execution()
-        assert governor.state.trade_count == 5
+@pytest.mark.parametrize(("symbol", "limit"), [("ES", 2), ("MES", 10)])
+def test_contract_limits(risk_config, symbols_config, symbol, limit):
+    governor = RiskGovernor(risk_config, symbols_config)
 
-        # Next check should fail
-        allowed, reason = governor.can_trade()
-        assert allowed is False
-        assert "Max trades" in reason
-        # But kill switch NOT active (soft stop)
-        assert governor.state.kill_switch_active is False
+    allowed, _ = governor.check_trade_risk(symbol, 1)
+    assert allowed is True
+    allowed, _ = governor.check_trade_risk(symbol, limit)
+    assert allowed is True
+    allowed, reason = governor.check_trade_risk(symbol, limit + 1)
+    assert allowed is False
+    assert f"exceeds max {limit}" in reason
 
-    def test_contract_limits(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
 
-        # ES Limit 2
-        allowed, _ = governor.check_trade_risk("ES", 1)
-        assert allowed is True
-        allowed, _ = governor.check_trade_risk("ES", 2)
-        assert allowed is True
-        allowed, reason = governor.check_trade_risk("ES", 3)
-        assert allowed is False
-        assert "exceeds max 2" in reason
+def test_risk_per_trade_usd(risk_config, symbols_config):
+    governor = RiskGovernor(risk_config, symbols_config)
 
-        # MES Limit 10
-        allowed, _ = governor.check_trade_risk("MES", 10)
-        assert allowed is True
-        allowed, reason = governor.check_trade_risk("MES", 11)
-        assert allowed is False
-        assert "exceeds max 10" in reason
+    # Config: Max $200
+    # ES: $12.50 per tick, $50 per point.
+    # Limit $200 = 4 points = 16 ticks.
 
-    def test_risk_per_trade_usd(self, risk_config, symbols_config):
-        governor = RiskGovernor(risk_config, symbols_config)
+    entry = Decimal("5000.00")
 
-        # Config: Max $200
-        # ES: $12.50 per tick, $50 per point.
-        # Limit $200 = 4 points = 16 ticks.
+    # Safe: 3 points stop (12 ticks * 12.50 = $150)
+    stop_safe = Decimal("4997.00")
+    allowed, _ = governor.check_trade_risk("ES", 1, entry, stop_safe)
+    assert allowed is True
 
-        entry = Decimal("5000.00")
+    # Unsafe: 5 points stop (20 ticks * 12.50 = $250)
+    stop_unsafe = Decimal("4995.00")
+    allowed, reason = governor.check_trade_risk("ES", 1, entry, stop_unsafe)
+    assert allowed is False
+    # Expected risk: 250.00
+    assert "exceeds limit $200" in reason
 
-        # Safe: 3 points stop (12 ticks * 12.50 = $150)
-        stop_safe = Decimal("4997.00")
-        allowed, _ = governor.check_trade_risk("ES", 1, entry, stop_safe)
-        assert allowed is True
+    # Unsafe: 2 contracts * 3 points ($300)
+    allowed, reason = governor.check_trade_risk("ES", 2, entry, stop_safe)
+    assert allowed is False
+    assert "exceeds limit $200" in reason
 
-        # Unsafe: 5 points stop (20 ticks * 12.50 = $250)
-        stop_unsafe = Decimal("4995.00")
-        allowed, reason = governor.check_trade_risk("ES", 1, entry, stop_unsafe)
-        assert allowed is False
-        # Expected risk: 250.00
-        assert "exceeds limit $200" in reason
-
-        # Unsafe: 2 contracts * 3 points ($300)
-        allowed, reason = governor.check_trade_risk("ES", 2, entry, stop_safe)
-        assert allowed is False
-        assert "exceeds limit $200" in reason
-
-    def test_kill_switch_config(self, risk_config, symbols_config):
-        risk_config.kill_switch = True
-        governor = RiskGovernor(risk_config, symbols_config)
-        assert governor.state.kill_switch_active is True
-        allowed, _ = governor.can_trade()
-        assert allowed is False
+
+def test_kill_switch_config(risk_config, symbols_config):
+    cfg = risk_config.model_copy(update={"kill_switch": True})
+    governor = RiskGovernor(cfg, symbols_config)
+    assert governor.state.kill_switch_active is True
+    allowed, _ = governor.can_trade()
+    assert allowed is False
+
+    # The session-scoped config is shared with every other test
+    assert risk_config.kill_switch is False
+
+
+def test_reset_clears_state_and_kill_switch(risk_config, symbols_config):
+    governor = RiskGovernor(risk_config, symbols_config)
+    governor.record_trade_execution()
+    governor.trip_kill_switch("Test")
+
+    governor.reset()
+
+    assert governor.state.trade_count == 0
+    assert governor.state.kill_switch_active is False
+    allowed, _ = governor.can_trade()
+    assert allowed is True
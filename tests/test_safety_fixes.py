@@ -8,7 +8,6 @@ import pytest
 
 from tsxbot.broker.models import Fill, Order, OrderRequest
 from tsxbot.broker.sim import SimBroker
-from tsxbot.config_loader import RiskConfig, SessionConfig, SymbolsConfig, SymbolSpecConfig
 from tsxbot.constants import OrderSide, OrderStatus, OrderType, SignalDirection
 from tsxbot.data.market_data import Tick
 from tsxbot.execution.engine import ExecutionEngine
@@ -16,108 +15,81 @@ from tsxbot.risk.risk_governor import RiskGovernor
 from tsxbot.strategies.base import TradeSignal
 from tsxbot.time.session_manager import SessionManager
 
+# symbols_config, risk_config and session_config come from conftest.
 
-@pytest.fixture
-def symbols_config():
-    return SymbolsConfig(
-        primary="ES",
-        micros="MES",
-        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
-        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
-    )
+# Tick, OrderRequest and Fill never mutate these, so tests share them
+_TS = datetime(2024, 1, 3, 10, 0)
+_PRICE_4990 = Decimal("4990.00")
+_PRICE_4995 = Decimal("4995.00")
+_PRICE_5000 = Decimal("5000.00")
+_PRICE_5005 = Decimal("5005.00")
+_TICK_5000 = Tick("ES", _TS, _PRICE_5000, 1)
 
 
-@pytest.fixture
-def risk_config():
-    return RiskConfig(
-        daily_loss_limit_usd=Decimal("500.00"),
-        max_trades_per_day=5,
-        max_risk_per_trade_usd=Decimal("100.00"),
-    )
-
-
-@pytest.fixture
-def session_config():
-    return SessionConfig(
-        timezone="America/New_York",
-        rth_start="09:30",
-        rth_end="16:00",
-        flatten_time="15:55",
-        trading_days=[0, 1, 2, 3, 4],
-    )
+@pytest.fixture(scope="module")
+def safety_risk_config(risk_config):
+    # This module's limits predate the shared config: 100 USD per trade
+    return risk_config.model_copy(update={"max_risk_per_trade_usd": Decimal("100.00")})
 
 
 @pytest.fixture
 def broker(symbols_config):
+    # Fresh per test: its own orders, positions and fill callbacks
     return SimBroker(symbols_config)
 
 
-@pytest.fixture
-def risk_governor(risk_config, symbols_config):
-    return RiskGovernor(risk_config, symbols_config)
+@pytest.fixture(scope="module")
+def _shared_risk_governor(safety_risk_config, symbols_config):
+    return RiskGovernor(safety_risk_config, symbols_config)
 
 
 @pytest.fixture
+def risk_governor(_shared_risk_governor):
+    _shared_risk_governor.reset()
+    return _shared_risk_governor
+
+
+@pytest.fixture(scope="module")
 def session_manager(session_config):
+    # SessionManager only holds values parsed from its config, so one is enough
     return SessionManager(session_config)
 
 
 class TestSimBrokerStopOrders:
     """Tests for STOP order matching in SimBroker (Fix #1)."""
 
-    @pytest.mark.asyncio
-    async def test_sell_stop_triggers_on_price_drop(self, broker):
-        """SELL STOP should trigger when price drops to or below stop price."""
-        # Place SELL STOP @ 4995 (protecting a long position)
-        req = OrderRequest("ES", OrderSide.SELL, 1, OrderType.STOP, stop_price=Decimal("4995.00"))
-        order = await broker.place_order(req)
-        assert order.status == OrderStatus.PENDING
-
-        # Price at 5000 - stop not triggered
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
-        assert order.status == OrderStatus.PENDING
-
-        # Price drops to exactly stop price - should trigger
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("4995.00"), 1))
-        assert order.status == OrderStatus.FILLED
-        assert order.avg_fill_price == Decimal("4995.00")
-
-    @pytest.mark.asyncio
-    async def test_buy_stop_triggers_on_price_rise(self, broker):
-        """BUY STOP should trigger when price rises to or above stop price."""
-        # Place BUY STOP @ 5005 (protecting a short position)
-        req = OrderRequest("ES", OrderSide.BUY, 1, OrderType.STOP, stop_price=Decimal("5005.00"))
+    @pytest.mark.parametrize(
+        ("side", "stop", "ticks", "expected_fill"),
+        [
+            # SELL STOP protecting a long: price drops to exactly the stop
+            (OrderSide.SELL, _PRICE_4995, [_PRICE_5000, _PRICE_4995], _PRICE_4995),
+            # BUY STOP protecting a short: price rises to exactly the stop
+            (OrderSide.BUY, _PRICE_5005, [_PRICE_5000, _PRICE_5005], _PRICE_5005),
+            # Gap from 5000 straight through 4995 to 4990. Filled at the stop
+            # price, not the gap price, for simplicity
+            (OrderSide.SELL, _PRICE_4995, [_PRICE_5000, _PRICE_4990], _PRICE_4995),
+        ],
+        ids=["sell_stop_on_drop", "buy_stop_on_rise", "gap_through"],
+    )
+    async def test_stop_trigger(self, broker, side, stop, ticks, expected_fill):
+        """STOP orders stay pending until price reaches or crosses the stop."""
+        req = OrderRequest("ES", side, 1, OrderType.STOP, stop_price=stop)
         order = await broker.place_order(req)
         assert order.status == OrderStatus.PENDING
 
-        # Price at 5000 - stop not triggered
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
+        # First tick at 5000 - stop not triggered
+        first, second = ticks
+        await broker.process_tick(Tick("ES", _TS, first, 1))
         assert order.status == OrderStatus.PENDING
 
-        # Price rises to exactly stop price - should trigger
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5005.00"), 1))
+        await broker.process_tick(Tick("ES", _TS, second, 1))
         assert order.status == OrderStatus.FILLED
-        assert order.avg_fill_price == Decimal("5005.00")
-
-    @pytest.mark.asyncio
-    async def test_stop_triggers_on_gap_through(self, broker):
-        """Stop should trigger even on a gap through the stop price."""
-        req = OrderRequest("ES", OrderSide.SELL, 1, OrderType.STOP, stop_price=Decimal("4995.00"))
-        order = await broker.place_order(req)
-
-        # Price gaps from 5000 directly to 4990 (through stop)
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("4990.00"), 1))
-
-        assert order.status == OrderStatus.FILLED
-        # Filled at stop price (not gap price for simplicity)
-        assert order.avg_fill_price == Decimal("4995.00")
+        assert order.avg_fill_price == expected_fill
 
 
 class TestDryRunEnforcement:
     """Tests for DRY_RUN blocking orders (Fix #2)."""
 
-    @pytest.mark.asyncio
     async def test_dry_run_blocks_order_placement(self, broker, risk_governor, symbols_config):
         """When dry_run=True, no orders should be placed."""
         engine = ExecutionEngine(
@@ -127,7 +99,7 @@ class TestDryRunEnforcement:
         signal = TradeSignal(
             symbol="ES",
             direction=SignalDirection.LONG,
-            timestamp=datetime.now(),
+            timestamp=_TS,
             quantity=1,
             entry_type=OrderType.MARKET,
         )
@@ -138,7 +110,6 @@ class TestDryRunEnforcement:
         orders = await broker.get_orders()
         assert len(orders) == 0
 
-    @pytest.mark.asyncio
     async def test_non_dry_run_places_orders(self, broker, risk_governor, symbols_config):
         """When dry_run=False, orders should be placed normally."""
         engine = ExecutionEngine(
@@ -146,12 +117,12 @@ class TestDryRunEnforcement:
         )
 
         # Provide tick data for immediate fill
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
+        await broker.process_tick(_TICK_5000)
 
         signal = TradeSignal(
             symbol="ES",
             direction=SignalDirection.LONG,
-            timestamp=datetime.now(),
+            timestamp=_TS,
             quantity=1,
             entry_type=OrderType.MARKET,
         )
@@ -165,7 +136,6 @@ class TestDryRunEnforcement:
 class TestRTHEnforcement:
     """Tests for RTH enforcement in ExecutionEngine (Fix #3)."""
 
-    @pytest.mark.asyncio
     async def test_signal_rejected_outside_rth(self, broker, risk_governor, symbols_config):
         """Signals should be rejected when outside RTH."""
         # Create mock session manager that says we're outside trading hours
@@ -181,9 +151,7 @@ class TestRTHEnforcement:
             dry_run=False,
         )
 
-        signal = TradeSignal(
-            symbol="ES", direction=SignalDirection.LONG, timestamp=datetime.now(), quantity=1
-        )
+        signal = TradeSignal(symbol="ES", direction=SignalDirection.LONG, timestamp=_TS, quantity=1)
 
         await engine.process_signal(signal)
 
@@ -192,7 +160,6 @@ class TestRTHEnforcement:
         assert len(orders) == 0
         mock_session.is_trading_allowed.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_signal_processed_during_rth(self, broker, risk_governor, symbols_config):
         """Signals should be processed when within RTH."""
         mock_session = MagicMock()
@@ -208,12 +175,12 @@ class TestRTHEnforcement:
         )
 
         # Provide tick for fill
-        await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
+        await broker.process_tick(_TICK_5000)
 
         signal = TradeSignal(
             symbol="ES",
             direction=SignalDirection.LONG,
-            timestamp=datetime.now(),
+            timestamp=_TS,
             quantity=1,
             entry_type=OrderType.MARKET,
         )
@@ -225,31 +192,33 @@ class TestRTHEnforcement:
         assert len(engine.active_trades) > 0
 
 
+class _StopFailingBroker:
+    """Minimal broker stand-in that fills every order except STOPs, which raise."""
+
+    def __init__(self):
+        self._fill_callbacks = []
+        self.placed: list[Order] = []
+
+    def add_fill_callback(self, cb):
+        self._fill_callbacks.append(cb)
+
+    async def place_order(self, req):
+        if req.type == OrderType.STOP:
+            raise Exception("Simulated stop order failure")
+        order = Order(id="test-id", request=req, status=OrderStatus.FILLED)
+        self.placed.append(order)
+        return order
+
+
 class TestStopFailureHandling:
     """Tests for emergency flatten on stop failure (Fix #4)."""
 
-    @pytest.mark.asyncio
     async def test_stop_failure_triggers_emergency_flatten(self, risk_governor, symbols_config):
         """When stop order fails, position should be emergency flattened."""
-        # Create broker mock that fails on STOP orders
-        mock_broker = MagicMock()
-        mock_broker._fill_callbacks = []
-        mock_broker.add_fill_callback = lambda cb: mock_broker._fill_callbacks.append(cb)
-
-        # Track placed orders
-        placed_orders = []
-
-        async def mock_place_order(req):
-            if req.type == OrderType.STOP:
-                raise Exception("Simulated stop order failure")
-            order = Order(id="test-id", request=req, status=OrderStatus.FILLED)
-            placed_orders.append(order)
-            return order
-
-        mock_broker.place_order = mock_place_order
+        broker = _StopFailingBroker()
 
         engine = ExecutionEngine(
-            mock_broker,
+            broker,
             risk_governor,
             symbols_config,
             journal=None,
@@ -260,7 +229,7 @@ class TestStopFailureHandling:
         signal = TradeSignal(
             symbol="ES",
             direction=SignalDirection.LONG,
-            timestamp=datetime.now(),
+            timestamp=_TS,
             quantity=1,
             entry_type=OrderType.MARKET,
             stop_ticks=8,
@@ -276,14 +245,15 @@ class TestStopFailureHandling:
             symbol="ES",
             side=OrderSide.BUY,
             qty=1,
-            price=Decimal("5000.00"),
-            timestamp=datetime.now(),
+            price=_PRICE_5000,
+            timestamp=_TS,
         )
 
         await engine.on_fill(fill)
 
         # Should have placed entry (1) and emergency flatten order (2)
         # Entry = MARKET BUY, Flatten = MARKET SELL
+        placed_orders = broker.placed
         assert len(placed_orders) == 2
         assert placed_orders[0].request.side == OrderSide.BUY  # Entry
         assert placed_orders[1].request.side == OrderSide.SELL  # Flatten
@@ -296,9 +266,9 @@ class TestStopFailureHandling:
 class TestDailyRiskReset:
     """Tests for daily risk reset functionality (Fix #10)."""
 
-    def test_reset_daily_clears_counters(self, risk_config, symbols_config):
+    def test_reset_daily_clears_counters(self, safety_risk_config, symbols_config):
         """Daily reset should clear trade count and daily PnL."""
-        governor = RiskGovernor(risk_config, symbols_config)
+        governor = RiskGovernor(safety_risk_config, symbols_config)
 
         # Simulate some trading activity
         governor.record_trade_execution()
@@ -315,9 +285,9 @@ class TestDailyRiskReset:
         assert governor.state.daily_pnl == Decimal("0.0")
         assert governor.state.high_water_mark == Decimal("50000")
 
-    def test_reset_daily_preserves_kill_switch(self, risk_config, symbols_config):
+    def test_reset_daily_preserves_kill_switch(self, safety_risk_config, symbols_config):
         """Daily reset should NOT clear kill switch for safety."""
-        governor = RiskGovernor(risk_config, symbols_config)
+        governor = RiskGovernor(safety_risk_config, symbols_config)
 
         # Trip kill switch
         governor.trip_kill_switch("Test reason")
@@ -330,9 +300,9 @@ class TestDailyRiskReset:
         assert governor.state.kill_switch_active is True
         assert governor.state.kill_switch_reason == "Test reason"
 
-    def test_reset_kill_switch_explicit(self, risk_config, symbols_config):
+    def test_reset_kill_switch_explicit(self, safety_risk_config, symbols_config):
         """Kill switch should require explicit reset."""
-        governor = RiskGovernor(risk_config, symbols_config)
+        governor = RiskGovernor(safety_risk_config, symbols_config)
 
         governor.trip_kill_switch("Test reason")
         assert governor.state.kill_switch_active is True
@@ -1,5 +1,6 @@
 """Tests for SimBroker."""
 
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 
@@ -7,21 +8,12 @@ import pytest
 
 from tsxbot.broker.models import OrderRequest
 from tsxbot.broker.sim import SimBroker
-from tsxbot.config_loader import CommissionConfig, ExecutionConfig, SymbolsConfig, SymbolSpecConfig
+from tsxbot.config_loader import CommissionConfig, ExecutionConfig
 from tsxbot.constants import OrderSide, OrderStatus, OrderType
 from tsxbot.data.market_data import Tick
 
 
-@pytest.fixture
-def symbols_config():
-    return SymbolsConfig(
-        primary="ES",
-        micros="MES",
-        es=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("12.50")),
-        mes=SymbolSpecConfig(tick_size=Decimal("0.25"), tick_value=Decimal("1.25")),
-    )
-
-
+# symbols_config comes from conftest.
 @pytest.fixture
 def broker(symbols_config):
     # Zero slippage and zero commission for predictable test results
@@ -34,23 +26,31 @@ def broker(symbols_config):
     )
 
 
-@pytest.mark.asyncio
+async def flush(rounds=4):
+    """Yield to the event loop until the broker's pending match tasks have run."""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+
+
+async def feed_ticks(broker, ticks):
+    """Feed ticks to the broker one at a time, in order."""
+    for tick in ticks:
+        await broker.process_tick(tick)
+
+
 async def test_market_order_nofill_without_data(broker):
     req = OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET)
     order = await broker.place_order(req)
     assert order.status == OrderStatus.PENDING
 
 
-@pytest.mark.asyncio
 async def test_market_order_instant_fill(broker):
     tick = Tick("ES", datetime.now(), Decimal("5000.00"), 1)
     await broker.process_tick(tick)
 
     req = OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET)
     order = await broker.place_order(req)
-    import asyncio
-
-    await asyncio.sleep(0.01)
+    await flush()
 
     assert order.status == OrderStatus.FILLED
     assert order.avg_fill_price == Decimal("5000.00")
@@ -60,7 +60,6 @@ async def test_market_order_instant_fill(broker):
     assert pos.avg_price == Decimal("5000.00")
 
 
-@pytest.mark.asyncio
 async def test_market_order_delayed_fill(broker):
     req = OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET)
     order = await broker.place_order(req)
@@ -77,7 +76,6 @@ async def test_market_order_delayed_fill(broker):
     assert pos.avg_price == Decimal("5002.50")
 
 
-@pytest.mark.asyncio
 async def test_limit_order(broker):
     # Buy Limit @ 5000
     req = OrderRequest("ES", OrderSide.BUY, 1, OrderType.LIMIT, limit_price=Decimal("5000.00"))
@@ -93,92 +91,110 @@ async def test_limit_order(broker):
     assert order.avg_fill_price == Decimal("5000.00")
 
 
-@pytest.mark.asyncio
-async def test_pnl_calculation_long_profit(broker):
-    # ES Multiplier: 50.0
-
-    # 1. Buy 1 @ 5000
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET))
-    import asyncio
-
-    await asyncio.sleep(0.01)
-
-    # Val: 1 * 5000. Cost = 5000.
-
-    # 2. Sell 1 @ 5010 (+10 pts)
-    # Profit = 10 * 50 = $500
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5010.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.SELL, 1, OrderType.MARKET))
-    import asyncio
-
-    await asyncio.sleep(0.01)
-
-    pos = await broker.get_position("ES")
+# ES multiplier is $50/pt. Each leg is (tick price, side, qty) followed by the
+# expected position after the fill: (qty, avg price, realized PnL).
+@pytest.mark.parametrize(
+    ("legs", "expected_balance"),
+    [
+        pytest.param(
+            [
+                ("5000.00", OrderSide.BUY, 1, (1, "5000.00", "0")),
+                # Sell @ 5010: +10 pts = $500
+                ("5010.00", OrderSide.SELL, 1, (0, "0", "500.00")),
+            ],
+            "100500.00",
+            id="long_profit",
+        ),
+        pytest.param(
+            [
+                ("5000.00", OrderSide.SELL, 1, (-1, "5000.00", "0")),
+                # Buy @ 5010: -10 pts = -$500
+                ("5010.00", OrderSide.BUY, 1, (0, "0", "-500.00")),
+            ],
+            "99500.00",
+            id="short_loss",
+        ),
+        pytest.param(
+            [
+                ("5000.00", OrderSide.BUY, 1, (1, "5000.00", "0")),
+                # Sell 2 @ 5010: close long for $500, open short 1 @ 5010
+                ("5010.00", OrderSide.SELL, 2, (-1, "5010.00", "500.00")),
+                # Buy 1 @ 5005: close short for (5010 - 5005) * 50 = $250
+                ("5005.00", OrderSide.BUY, 1, (0, "0", "750.00")),
+            ],
+            "100750.00",
+            id="position_flip",
+        ),
+    ],
+)
+async def test_pnl_calculation(broker, legs, expected_balance):
+    for price, side, qty, (pos_qty, avg_price, realized_pnl) in legs:
+        await broker.process_tick(Tick("ES", datetime.now(), Decimal(price), 1))
+        await broker.place_order(OrderRequest("ES", side, qty, OrderType.MARKET))
+        await flush()
+
+        pos = await broker.get_position("ES")
+        assert pos.qty == pos_qty
+        assert pos.avg_price == Decimal(avg_price)
+        assert pos.realized_pnl == Decimal(realized_pnl)
+
+    assert await broker.get_account_balance() == Decimal(expected_balance)
+
+
+async def test_pnl_calculation_mes(broker):
+    # MES multiplier is $5/pt: buy @ 5000, sell @ 5010 = +$50
+    for price, side in (("5000.00", OrderSide.BUY), ("5010.00", OrderSide.SELL)):
+        await broker.process_tick(Tick("MES", datetime.now(), Decimal(price), 1))
+        await broker.place_order(OrderRequest("MES", side, 1, OrderType.MARKET))
+        await flush()
+
+    pos = await broker.get_position("MES")
     assert pos.qty == 0
-    assert pos.realized_pnl == Decimal("500.00")
+    assert pos.realized_pnl == Decimal("50.00")
+    assert await broker.get_account_balance() == Decimal("100050.00")
 
-    bal = await broker.get_account_balance()
-    assert bal == Decimal("100500.00")
 
-
-@pytest.mark.asyncio
-async def test_pnl_calculation_short_loss(broker):
-    # 1. Sell 1 @ 5000
+async def test_reset_clears_state(broker):
     await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.SELL, 1, OrderType.MARKET))
-    import asyncio
-
-    await asyncio.sleep(0.01)
+    limit = OrderRequest("ES", OrderSide.BUY, 1, OrderType.LIMIT, Decimal("4990.00"))
+    await broker.place_order(limit)
 
-    # 2. Buy 1 @ 5010 (-10 pts)
-    # Loss = 10 * 50 = $500
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5010.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET))
-    import asyncio
-
-    await asyncio.sleep(0.01)
-
-    pos = await broker.get_position("ES")
-    assert pos.qty == 0
-    assert pos.realized_pnl == Decimal("-500.00")
+    broker.reset()
 
-    bal = await broker.get_account_balance()
-    assert bal == Decimal("99500.00")
+    assert await broker.get_orders() == []
+    assert (await broker.get_position("ES")).qty == 0
+    assert await broker.get_account_balance() == Decimal("100000.00")
 
+    # No market data survives the reset, so market orders wait for a tick
+    order = await broker.place_order(OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET))
+    assert order.status == OrderStatus.PENDING
 
-@pytest.mark.asyncio
-async def test_position_flip(broker):
-    # 1. Buy 1 @ 5000
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5000.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET))
-    import asyncio
-
-    await asyncio.sleep(0.01)
 
-    # 2. Sell 2 @ 5010 (Flip to Short 1)
-    # Close 1 @ 5010: Profit $500.
-    # Open Short 1 @ 5010.
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5010.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.SELL, 2, OrderType.MARKET))
-    import asyncio
+async def test_fill_callback_fires_before_tick_callback(broker):
+    events = []
 
-    await asyncio.sleep(0.01)
+    async def on_fill(fill):
+        events.append(("fill", fill.price))
 
-    pos = await broker.get_position("ES")
-    assert pos.qty == -1
-    assert pos.avg_price == Decimal("5010.00")
-    assert pos.realized_pnl == Decimal("500.00")
+    async def on_tick(tick):
+        events.append(("tick", tick.price))
 
-    # 3. Buy 1 @ 5005 (Close Short)
-    # Profit: (5010 - 5005) * 50 = 5 * 50 = $250
-    # Total PnL: 500 + 250 = 750
-    await broker.process_tick(Tick("ES", datetime.now(), Decimal("5005.00"), 1))
-    await broker.place_order(OrderRequest("ES", OrderSide.BUY, 1, OrderType.MARKET))
-    import asyncio
+    broker.add_fill_callback(on_fill)
+    broker.add_tick_callback(on_tick)
+    req = OrderRequest("ES", OrderSide.SELL, 1, OrderType.STOP, stop_price=Decimal("4995.00"))
+    await broker.place_order(req)
 
-    await asyncio.sleep(0.01)
+    await feed_ticks(
+        broker,
+        [
+            Tick("ES", datetime.now(), Decimal("5000.00"), 1),
+            Tick("ES", datetime.now(), Decimal("4990.00"), 1),
+        ],
+    )
 
-    pos = await broker.get_position("ES")
-    assert pos.qty == 0
-    assert pos.realized_pnl == Decimal("750.00")
+    # Strategies see the fill before the tick that caused it
+    assert events == [
+        ("tick", Decimal("5000.00")),
+        ("fill", Decimal("4995.00")),
+        ("tick", Decimal("4990.00")),
+    ]
@@ -0,0 +1,150 @@
+"""Tests for the stream verification script's quote handling."""
+
+import importlib.util
+import logging
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# tools/ is not a package; load the script by path
+_SCRIPT = Path(__file__).resolve().parents[1] / "tools" / "verify_stream.py"
+_spec = importlib.util.spec_from_file_location("verify_stream", _SCRIPT)
+verify_stream = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verify_stream)
+
+ES = "CON.F.US.EP.H26"
+
+
+@pytest.fixture
+def verifier():
+    verifier = verify_stream.StreamVerifier()
+    verifier._add_contract(ES)
+    return verifier
+
+
+class TestDrain:
+    """Tests for folding queued stream events into the quote columns."""
+
+    def test_last_value_wins_per_field(self, verifier):
+        verifier._pending.extend(
+            [
+                (0, 5750.00, 5750.25, 5750.00, 1),
+                (0, 5750.25, 5750.50, 5750.25, 2),
+            ]
+        )
+
+        verifier.drain()
+
+        assert list(verifier.quotes()) == [
+            (ES, Decimal("5750.25"), Decimal("5750.5"), Decimal("5750.25"))
+        ]
+        assert verifier._ts[0] == 2
+        assert verifier.tick_count == 2
+
+    def test_none_field_keeps_earlier_value(self, verifier):
+        # Quote, then a trade that only carries a last price
+        verifier._pending.extend(
+            [
+                (0, 5750.00, 5750.25, None, 1),
+                (0, None, None, 5750.25, 2),
+            ]
+        )
+        verifier.drain()
+
+        # A later interval with only a bid leaves ask and last alone
+        verifier._pending.append((0, 5749.75, None, None, 3))
+        verifier.drain()
+
+        assert list(verifier.quotes()) == [
+            (ES, Decimal("5749.75"), Decimal("5750.25"), Decimal("5750.25"))
+        ]
+        assert verifier.tick_count == 3
+
+    def test_no_events_leaves_contract_without_data(self, verifier):
+        verifier.drain()
+
+        assert list(verifier.quotes()) == []
+        assert verifier.tick_count == 0
+
+
+class TestKeyLearning:
+    """Tests for per-contract quote and trade field name learning."""
+
+    def test_keys_learned_on_first_tick(self, verifier):
+        handler = verifier._on_quote(ES, 0)
+
+        handler({"bestBid": 5750.00, "bestAsk": 5750.25, "lastPrice": 5750.00})
+        handler({"bestBid": 5750.25, "bestAsk": 5750.50, "lastPrice": 5750.25})
+
+        assert [event[:4] for event in verifier._pending] == [
+            (0, 5750.00, 5750.25, 5750.00),
+            (0, 5750.25, 5750.50, 5750.25),
+        ]
+
+    def test_field_first_seen_on_later_tick(self, verifier):
+        handler = verifier._on_quote(ES, 0)
+
+        handler({"bid": 5750.00, "ask": 5750.25})
+        handler({"bid": 5750.00, "ask": 5750.25, "last": 5750.25})
+
+        assert [event[1:4] for event in verifier._pending] == [
+            (5750.00, 5750.25, None),
+            (5750.00, 5750.25, 5750.25),
+        ]
+
+    def test_payload_without_learned_key_is_logged(self, verifier, caplog):
+        caplog.set_level(logging.DEBUG, logger=verify_stream.logger.name)
+        handler = verifier._on_quote(ES, 0)
+
+        handler({"bestBid": 5750.00, "bestAsk": 5750.25, "lastPrice": 5750.00})
+        handler({"Bid": 5750.25, "bestAsk": 5750.50, "lastPrice": 5750.25})
+
+        # The learned key wins; the differently spelled field is not picked up
+        assert verifier._pending[1][1:4] == (None, 5750.50, 5750.25)
+        assert "lacks learned keys ['bestBid']" in caplog.text
+
+    def test_trade_key_learned_and_missing_key_logged(self, verifier, caplog):
+        caplog.set_level(logging.DEBUG, logger=verify_stream.logger.name)
+        handler = verifier._on_trade(ES, 0)
+
+        handler({"Price": 5750.25})
+        handler({"price": 5750.50})
+
+        assert [event[3] for event in verifier._pending] == [5750.25, None]
+        assert "lacks learned key 'Price'" in caplog.text
+
+
+class TestValidatePrice:
+    """Tests for the ES/MES price sanity checks."""
+
+    @pytest.mark.parametrize(
+        ("price", "ok", "message"),
+        [
+            ("5750.25", True, "OK"),
+            ("3500", True, "OK"),
+            ("8000.00", True, "OK"),
+            ("0", False, "Price is 0"),
+            ("57502500", False, "likely scaled up"),
+            ("57.50", False, "likely scaled down"),
+            ("3499.75", False, "outside expected range"),
+            ("8000.25", False, "outside expected range"),
+            ("5750.10", False, "not on 0.25 tick increment"),
+        ],
+        ids=[
+            "on_tick",
+            "lower_bound",
+            "upper_bound",
+            "zero",
+            "scaled_up",
+            "scaled_down",
+            "below_range",
+            "above_range",
+            "off_tick",
+        ],
+    )
+    def test_validate_price(self, verifier, price, ok, message):
+        result, msg = verifier.validate_price(Decimal(price), ES)
+
+        assert result is ok
+        assert message in msg
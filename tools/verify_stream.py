@@ -12,31 +12,51 @@ import logging
 import os
 import sys
 import time
-from datetime import datetime, timedelta
+from collections import deque
 from decimal import Decimal
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any
 
-# Load environment variables
 from dotenv import load_dotenv
-load_dotenv()
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    datefmt='%H:%M:%S'
-)
+
 logger = logging.getLogger(__name__)
 
-# Import tsxapipy
+# Import tsxapipy (checked in main(), so the parsing logic can be imported without it)
 try:
     from tsxapipy.api import APIClient as TSXClient
     from tsxapipy.real_time import DataStream
     from tsxapipy.auth import authenticate as tsx_authenticate
 except ImportError as e:
-    logger.error(f"Failed to import tsxapipy: {e}")
-    logger.error("Install with: pip install tsxapipy")
-    sys.exit(1)
+    TSXClient = DataStream = tsx_authenticate = None
+    _TSXAPIPY_IMPORT_ERROR = e
+else:
+    _TSXAPIPY_IMPORT_ERROR = None
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _to_decimal(value) -> Decimal:
+    """Convert a raw feed price to Decimal; L1 prices repeat, so most calls hit the cache."""
+    return Decimal(str(value))
+
+
+# Candidate field names, in preference order; the feed sticks to one per field
+_BID_KEYS = ('bid', 'bestBid', 'Bid')
+_ASK_KEYS = ('ask', 'bestAsk', 'Ask')
+_LAST_KEYS = ('lastPrice', 'LastPrice', 'last')
+_QUOTE_KEYS = (_BID_KEYS, _ASK_KEYS, _LAST_KEYS)
+_TRADE_PRICE_KEYS = ('price', 'Price')
+
+# print_prices row layout and display precision
+_PRICE_LINE = "  %-15s | Bid: %10s | Ask: %10s | Last: %10s | %s"
+_CENTS = Decimal("0.01")
+
+
+def _first_key(data: dict[str, Any], candidates: tuple) -> str | None:
+    """Return the first candidate key with a truthy value in data, or None."""
+    for key in candidates:
+        if data.get(key):
+            return key
+    return None
 
 
 class StreamVerifier:
@@ -44,10 +64,27 @@ class StreamVerifier:
     
     def __init__(self):
         self.client = None
-        self.streams: Dict[str, DataStream] = {}  # contract_id -> stream
-        self.latest_quotes = {}  # symbol -> {bid, ask, last, timestamp}
+        self.streams: dict[str, DataStream] = {}  # contract_id -> stream
+        # Latest quote per contract as parallel columns; subscribe() assigns
+        # each contract_id a row. Prices are Decimal, ts is monotonic_ns.
+        self._idx: dict[str, int] = {}
+        self._contracts = []  # row -> contract_id
+        self._bid = []
+        self._ask = []
+        self._last = []
+        self._ts = []
+        self._lines = []  # row -> formatted display line, rebuilt only when dirty
+        self._dirty = set()  # rows updated since the last print_prices
         self.tick_count = 0
         self.errors = []
+        # Raw (row, bid, ask, last, ts_ns) events from the stream
+        # threads, folded into the quote columns once per display interval.
+        # Unbounded: drain() empties it every second, and dropping events
+        # would undercount ticks.
+        self._pending = deque()
+        # Credentials read once by authenticate() and reused for client reauth
+        self._username = None
+        self._api_key = None
         
     def authenticate(self) -> tuple:
         """Authenticate with ProjectX API."""
@@ -60,6 +97,8 @@ class StreamVerifier:
                 "Set PROJECTX_USERNAME and PROJECTX_API_KEY in .env file"
             )
         
+        self._username, self._api_key = username, api_key
+
         logger.info(f"Authenticating as {username}...")
         token, token_time = tsx_authenticate(username, api_key)
         
@@ -70,46 +109,51 @@ class StreamVerifier:
         return token, token_time
     
     def connect(self, token: str, token_time):
-        """Initialize API client."""
-        username = os.getenv("PROJECTX_USERNAME")
-        api_key = os.getenv("PROJECTX_API_KEY")
-        
+        """Initialize API client. Call authenticate() first."""
         self.client = TSXClient(
             initial_token=token,
             token_acquired_at=token_time,
-            reauth_username=username,
-            reauth_api_key=api_key
+            reauth_username=self._username,
+            reauth_api_key=self._api_key
         )
         
         # Get accounts to verify connection
         accounts = self.client.get_accounts()
         if accounts:
-            acc_id = getattr(accounts[0], 'id', None) or accounts[0].get('id', 'unknown')
+            account = accounts[0]
+            if isinstance(account, dict):
+                acc_id = account.get('id', 'unknown')
+            else:
+                acc_id = getattr(account, 'id', 'unknown')
             logger.info(f"✓ Connected to account: {acc_id}")
         else:
             logger.warning("No accounts found")
         
-    def _on_quote(self, contract_id: str):
+    def _on_quote(self, contract_id: str, row: int):
         """Create quote handler for a specific contract."""
-        def handler(quote_data: Dict[str, Any]):
+        # bid/ask/last key names for this contract, learned from the first tick carrying each
+        keys = [None, None, None]
+
+        def handler(quote_data: dict[str, Any]):
             try:
-                # ProjectX uses these field names
-                bid = quote_data.get('bid') or quote_data.get('bestBid') or quote_data.get('Bid')
-                ask = quote_data.get('ask') or quote_data.get('bestAsk') or quote_data.get('Ask')
-                last = quote_data.get('lastPrice') or quote_data.get('LastPrice') or quote_data.get('last')
-                
-                if contract_id not in self.latest_quotes:
-                    self.latest_quotes[contract_id] = {}
+                if None in keys:
+                    for i, candidates in enumerate(_QUOTE_KEYS):
+                        if keys[i] is None:
+                            keys[i] = _first_key(quote_data, candidates)
                 
-                if bid is not None:
-                    self.latest_quotes[contract_id]['bid'] = Decimal(str(bid))
-                if ask is not None:
-                    self.latest_quotes[contract_id]['ask'] = Decimal(str(ask))
-                if last is not None:
-                    self.latest_quotes[contract_id]['last'] = Decimal(str(last))
-                self.latest_quotes[contract_id]['timestamp'] = datetime.now()
+                bid_key, ask_key, last_key = keys
+                bid = quote_data.get(bid_key) or None
+                ask = quote_data.get(ask_key) or None
+                last = quote_data.get(last_key) or None
+                if None in (bid, ask, last) and logger.isEnabledFor(logging.DEBUG):
+                    missing = [key for key in keys if key is not None and key not in quote_data]
+                    if missing:
+                        logger.debug(
+                            f"Quote for {contract_id} lacks learned keys {missing}: "
+                            f"{list(quote_data)}"
+                        )
                 
-                self.tick_count += 1
+                self._pending.append((row, bid, ask, last, time.monotonic_ns()))
                 
             except Exception as e:
                 self.errors.append(f"Quote parse error for {contract_id}: {e}")
@@ -117,20 +161,23 @@ class StreamVerifier:
         
         return handler
     
-    def _on_trade(self, contract_id: str):
+    def _on_trade(self, contract_id: str, row: int):
         """Create trade handler for a specific contract."""
-        def handler(trade_data: Dict[str, Any]):
+        price_key = None
+
+        def handler(trade_data: dict[str, Any]):
+            nonlocal price_key
             try:
-                price = trade_data.get('price') or trade_data.get('Price')
-                
-                if contract_id not in self.latest_quotes:
-                    self.latest_quotes[contract_id] = {}
-                
-                if price is not None:
-                    self.latest_quotes[contract_id]['last'] = Decimal(str(price))
-                self.latest_quotes[contract_id]['timestamp'] = datetime.now()
+                if price_key is None:
+                    price_key = _first_key(trade_data, _TRADE_PRICE_KEYS)
+                price = trade_data.get(price_key) or None
+                if price_key is not None and price_key not in trade_data:
+                    logger.debug(
+                        f"Trade for {contract_id} lacks learned key {price_key!r}: "
+                        f"{list(trade_data)}"
+                    )
                 
-                self.tick_count += 1
+                self._pending.append((row, None, None, price, time.monotonic_ns()))
                 logger.debug(f"Trade {contract_id}: {price}")
                 
             except Exception as e:
@@ -139,17 +186,28 @@ class StreamVerifier:
         
         return handler
         
+    def _add_contract(self, contract_id: str) -> int:
+        """Assign contract_id the next quote row and return its index."""
+        row = len(self._contracts)
+        self._idx[contract_id] = row
+        self._contracts.append(contract_id)
+        for column in (self._bid, self._ask, self._last, self._ts, self._lines):
+            column.append(None)
+        return row
+
     def subscribe(self, contract_ids: list[str]):
         """Subscribe to market data for multiple contracts."""
         for contract_id in contract_ids:
             logger.info(f"Creating stream for: {contract_id}")
             
+            row = self._add_contract(contract_id)
+
             # Create a stream for each contract with callbacks
             stream = DataStream(
                 api_client=self.client,
                 contract_id_to_subscribe=contract_id,
-                on_quote_callback=self._on_quote(contract_id),
-                on_trade_callback=self._on_trade(contract_id),
+                on_quote_callback=self._on_quote(contract_id, row),
+                on_trade_callback=self._on_trade(contract_id, row),
                 on_depth_callback=None,  # Not needed for price verification
                 auto_subscribe_quotes=True,
                 auto_subscribe_trades=True,
@@ -191,62 +249,115 @@ class StreamVerifier:
         if price is None:
             return False, "Price is None"
         
-        price_float = float(price)
+        # Work in quarter-ticks: exact for Decimal prices, no float round-trip
+        quarters = price * 4
         
         # Check for missing/zero
-        if price_float == 0:
+        if not quarters:
             return False, "Price is 0"
         
         # Check for integer scaling issue (price in cents/ticks)
-        if price_float > 100000:
-            return False, f"Price too high ({price_float}) - likely scaled up (cents?)"
+        if quarters > 400000:
+            return False, f"Price too high ({price}) - likely scaled up (cents?)"
         
         # Check for decimal scaling issue (price divided too much)
-        if price_float < 1000:
-            return False, f"Price too low ({price_float}) - likely scaled down"
+        if quarters < 4000:
+            return False, f"Price too low ({price}) - likely scaled down"
         
         # Check for valid ES/MES range (roughly 4000-7500 for S&P 500 futures in 2024-2026)
-        if not (3500 <= price_float <= 8000):
-            return False, f"Price {price_float} outside expected range [3500, 8000]"
+        if not (14000 <= quarters <= 32000):  # 3500-8000 points
+            return False, f"Price {price} outside expected range [3500, 8000]"
         
-        # Check tick size (should be divisible by 0.25)
-        remainder = price_float % 0.25
-        if remainder > 0.001:  # Small tolerance for float precision
-            return False, f"Price {price_float} not on 0.25 tick increment"
+        # Check tick size (should be a whole number of 0.25 ticks)
+        if quarters != int(quarters):
+            return False, f"Price {price} not on 0.25 tick increment"
         
         return True, "OK"
     
+    def drain(self):
+        """Fold queued stream events into the quote columns, keeping the last value per field."""
+        pending = self._pending
+        latest = {}  # row -> [bid, ask, last, ts_ns], raw
+        count = 0
+        while pending:
+            row, bid, ask, last, ts_ns = pending.popleft()
+            count += 1
+            slot = latest.get(row)
+            if slot is None:
+                slot = latest[row] = [None, None, None, None]
+            if bid is not None:
+                slot[0] = bid
+            if ask is not None:
+                slot[1] = ask
+            if last is not None:
+                slot[2] = last
+            slot[3] = ts_ns
+        self.tick_count += count
+
+        # Only the surviving value per field is converted to Decimal
+        columns = (self._bid, self._ask, self._last)
+        for row, slot in latest.items():
+            for column, raw in zip(columns, slot[:3], strict=True):
+                if raw is None:
+                    continue
+                try:
+                    column[row] = _to_decimal(raw)
+                except Exception as e:
+                    self.errors.append(f"Price parse error for {self._contracts[row]}: {e}")
+                    logger.error(f"Error parsing price: {e}, value: {raw!r}")
+            self._ts[row] = slot[3]
+        self._dirty.update(latest)
+
+    def quotes(self):
+        """Yield (contract_id, bid, ask, last) for each contract that has data, by contract_id."""
+        for contract_id, row in sorted(self._idx.items()):
+            if self._ts[row] is not None:
+                yield contract_id, self._bid[row], self._ask[row], self._last[row]
+
+    def _format_row(self, row: int) -> str:
+        """Build the display line for one contract row."""
+        symbol = self._contracts[row]
+        bid, ask, last = self._bid[row], self._ask[row], self._last[row]
+
+        # Format prices
+        bid_str = str(bid.quantize(_CENTS)) if bid is not None else '-'
+        ask_str = str(ask.quantize(_CENTS)) if ask is not None else '-'
+        last_str = str(last.quantize(_CENTS)) if last is not None else '-'
+
+        # Validate
+        validation_msgs = []
+        if last is not None:
+            ok, msg = self.validate_price(last, symbol)
+            if not ok:
+                validation_msgs.append(f"⚠️ {msg}")
+
+        status = " ".join(validation_msgs) if validation_msgs else "✓"
+
+        # Truncate symbol for display
+        symbol_short = symbol[-15:] if len(symbol) > 15 else symbol
+        return _PRICE_LINE % (symbol_short, bid_str, ask_str, last_str, status)
+
     def print_prices(self):
-        """Print current prices for all subscribed symbols."""
-        if not self.latest_quotes:
-            print("  [No data yet]")
+        """Print current prices for all subscribed symbols, or a single line if none changed."""
+        self.drain()
+        if not self._dirty:
+            if any(ts is not None for ts in self._ts):
+                print("  (no updates)")
+            else:
+                print("  [No data yet]")
             return
         
-        for symbol, data in sorted(self.latest_quotes.items()):
-            bid = data.get('bid', '-')
-            ask = data.get('ask', '-')
-            last = data.get('last', '-')
-            
-            # Format prices
-            bid_str = f"{bid:.2f}" if isinstance(bid, Decimal) else str(bid)
-            ask_str = f"{ask:.2f}" if isinstance(ask, Decimal) else str(ask)
-            last_str = f"{last:.2f}" if isinstance(last, Decimal) else str(last)
-            
-            # Validate
-            validation_msgs = []
-            if isinstance(last, Decimal):
-                ok, msg = self.validate_price(last, symbol)
-                if not ok:
-                    validation_msgs.append(f"⚠️ {msg}")
-            
-            status = " ".join(validation_msgs) if validation_msgs else "✓"
-            
-            # Truncate symbol for display
-            symbol_short = symbol[-15:] if len(symbol) > 15 else symbol
-            print(f"  {symbol_short:15s} | Bid: {bid_str:>10s} | Ask: {ask_str:>10s} | Last: {last_str:>10s} | {status}")
+        for row in self._dirty:
+            self._lines[row] = self._format_row(row)
+        self._dirty.clear()
 
+        for _, row in sorted(self._idx.items()):
+            line = self._lines[row]
+            if line is not None:
+                print(line)
 
-def main():
+
+async def main_async():
     """Run the stream verification."""
     print("\n" + "=" * 70)
     print("PROJECTX LIVE DATA STREAM VERIFICATION")
@@ -281,19 +392,24 @@ def main():
         print("Compare these values with your trading platform (TradingView/TopstepX)")
         print("-" * 70 + "\n")
         
-        start_time = datetime.now()
-        duration = timedelta(seconds=60)
+        # The stream threads only append to the verifier's queue; draining and
+        # display happen here, on the event loop, so nothing races the printout
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        duration = 60
         
-        while datetime.now() - start_time < duration:
-            elapsed = (datetime.now() - start_time).seconds
-            remaining = 60 - elapsed
+        for elapsed in range(duration):
+            remaining = duration - elapsed
             
+            verifier.drain()
             print(f"\n[{elapsed:02d}s elapsed, {remaining:02d}s remaining] Tick count: {verifier.tick_count}")
             verifier.print_prices()
             
-            time.sleep(1)
+            # Sleep to the next whole second from start so printing time doesn't drift the schedule
+            await asyncio.sleep(max(0.0, start + elapsed + 1 - loop.time()))
         
         # 7. Final summary
+        verifier.drain()
         print("\n" + "=" * 70)
         print("VERIFICATION SUMMARY")
         print("=" * 70)
@@ -309,8 +425,7 @@ def main():
         # Validate final prices
         print("\nFinal Price Validation:")
         all_valid = True
-        for symbol, data in verifier.latest_quotes.items():
-            last = data.get('last')
+        for symbol, _, _, last in verifier.quotes():
             if last:
                 ok, msg = verifier.validate_price(last, symbol)
                 status = "✓ PASS" if ok else f"✗ FAIL: {msg}"
@@ -336,5 +451,22 @@ def main():
         verifier.stop_streams()
 
 
+def main():
+    """Entry point: run the verification on a fresh event loop."""
+    # Load environment variables and set up logging here, not at import,
+    # so importing the module leaves os.environ and the root logger alone
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)s | %(message)s',
+        datefmt='%H:%M:%S'
+    )
+    if _TSXAPIPY_IMPORT_ERROR is not None:
+        logger.error(f"Failed to import tsxapipy: {_TSXAPIPY_IMPORT_ERROR}")
+        logger.error("Install with: pip install tsxapipy")
+        sys.exit(1)
+    asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()